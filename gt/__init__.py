@@ -1,8 +1,26 @@
-from gt.game_history import *
-from gt.game_score import *
-#
-from gt.strats import *
-#
-from gt.runner import *
-#
-from gt.tourney import *
+"""submodules are imported on first attribute access so `import gt` stays cheap for short-lived workers"""
+from gt._lazy import lazy_module
+
+__getattr__, __dir__, __all__ = lazy_module(
+    __name__,
+    {
+        'gt.game_history': ['HistoryEntry', 'GameHistory', 'RecentHistory', 'ArrayHistory', 'MoveFileSink', 'read_moves'],
+        'gt.game_score': ['GameScorer', 'OUTCOMES', 'count_outcomes', 'default_payoff'],
+        'gt.strats.strategy': [
+            'Strategy', 'TitForTat', 'AlwaysDefect', 'AlwaysCooperate', 'Random', 'TitForTwoTats',
+            'SometimesDefect', 'Grudger', 'Prober', 'Cooperator', 'Defector'
+        ],
+        'gt.runner.match_runner': ['MatchRunner'],
+        'gt.runner.metrics': ['MetricsRegistry', 'set_metrics'],
+        'gt.runner.progress': ['Progress'],
+        'gt.runner.shared': ['SharedMatchResults', 'MatchSchedule', 'play_matches_shared', 'MOVE_BITS', 'BIT_MOVES'],
+        'gt.tourney': [
+            'Tourney', 'MatchMaker', 'Player', 'AllPairs', 'random_player_name', 'sequential_player_name',
+            'set_player_name_factory'
+        ],
+    },
+    submodules=[
+        'adaptive', 'ai_tourney', 'bracket_sim', 'ecological', 'game_history', 'game_score', 'runner', 'strats',
+        'sweep', 'tourney'
+    ],
+)
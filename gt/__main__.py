@@ -1,28 +1,102 @@
+import argparse
+import csv
+import functools
+
 import gt
 
-def main():
-    run_tourney()
-
-def run_tourney():
-    players = [gt.TourneyPlayer(id=f"p{i}", name=f"gt.TourneyPlayer {i}") for i in range(1, 3)]
-    config = gt.TourneyConfig(tournament_type=gt.TourneyType.ROUND_ROBIN,
-                              name="Example Tourney",
-                              win_points=3,
-                              draw_points=1,
-                              loss_points=0,
-                              random_seed=42)
-    tourney = gt.Tourney(config=config, players=players)
-    print(tourney)
-
-def run_single_match():
-    scorer = gt.GameScorer()
-    player1 = gt.SometimesDefect(0.3)
-    player2 = gt.Prober()
-    match = gt.MatchRunner(player1, player2)
-    result = match.play()
-    print(result)
-    score = scorer.score_game(result)
-    print(score)
+BACKENDS = ('serial', 'batched', 'multiprocess')
+
+def main(argv=None):
+    args = parse_args(argv)
+    roster = [parse_strategy(spec) for spec in args.strategies]
+    matches, pairs = build_matches(roster, args.matches, args.gamelen, args.seed, args.jit)
+    registry = gt.MetricsRegistry(args.metrics) if args.metrics else None
+    if registry: gt.set_metrics(registry)
+    results = run(matches, args)
+    if registry: registry.close()
+    if args.output:
+        write_results(args.output, roster, pairs, results)
+    print_summary(roster, pairs, results)
+    return results
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m gt', description='play an all-pairs iterated prisoners dilemma')
+    parser.add_argument('strategies',
+                        nargs='*',
+                        default=['TitForTat', 'AlwaysDefect', 'AlwaysCooperate', 'Random', 'Grudger', 'Prober'],
+                        help='strategy roster, eg TitForTat SometimesDefect:0.1')
+    parser.add_argument('-n', '--matches', type=int, default=1000, help='total matches, cycling over all pairs')
+    parser.add_argument('-g', '--gamelen', type=parse_gamelen, default=(100, 100), help='moves per game, N or LO:HI')
+    parser.add_argument('-s', '--seed', type=int, default=None)
+    parser.add_argument('-w', '--workers',
+                        type=int,
+                        default=None,
+                        help='processes for the multiprocess backend, one per cpu by default')
+    parser.add_argument('-b', '--backend', choices=BACKENDS, default='batched')
+    parser.add_argument('--jit', action='store_true', help='play kernel strategies as compiled code if numba is installed')
+    parser.add_argument('--chunksize', type=int, default=64, help='matches per batch')
+    parser.add_argument('-o', '--output', default=None, help='write per-match results as csv')
+    parser.add_argument('--metrics', default=None, help='export metrics to this .prom or json lines file')
+    parser.add_argument('-q', '--quiet', action='store_true', help='no progress output')
+    args = parser.parse_args(argv)
+    if args.backend == 'multiprocess' and args.workers is not None and args.workers < 1:
+        parser.error('the multiprocess backend needs at least one worker, use -b batched to play in-process')
+    return args
+
+def parse_gamelen(text):
+    lo, _, hi = text.partition(':')
+    lo, hi = int(lo), int(hi or lo)
+    if not 0 < lo <= hi:
+        raise argparse.ArgumentTypeError(f'bad gamelen {text!r}')
+    return lo, hi
+
+def parse_strategy(spec):
+    """'Name' or 'Name:arg,arg' to a picklable Strategy factory"""
+    name, _, params = spec.partition(':')
+    cls = getattr(gt, name, None)
+    if not isinstance(cls, type) or not issubclass(cls, gt.Strategy):
+        raise SystemExit(f'unknown strategy {name!r}')
+    if getattr(cls.compute_move, '__isabstractmethod__', False):
+        raise SystemExit(f'strategy {name!r} has no compute_move to play')
+    args = [float(x) for x in params.split(',')] if params else []
+    return spec, functools.partial(cls, *args)
+
+def build_matches(roster, nmatch, gamelen, seed=None, jit=False):
+    """schedule nmatch matches cycling over all pairs of the roster, self-play included
+
+    The MatchRunners are built as they are played, in the worker that plays them.
+    """
+    schedule = gt.MatchSchedule([factory for _, factory in roster], nmatch, gamelen, seed, jit)
+    return schedule, schedule.pairs
+
+def run(matches, args):
+    progress = None if args.quiet else gt.Progress(len(matches))
+    nworkers, chunksize = 0, args.chunksize
+    if args.backend == 'serial':
+        chunksize = 1
+    elif args.backend == 'multiprocess':
+        nworkers = args.workers
+    results = gt.play_matches_shared(matches, nworkers, seed=args.seed, chunksize=chunksize, progress=progress)
+    if progress: progress.finish()
+    return results
+
+def write_results(path, roster, pairs, results):
+    with open(path, 'w', newline='') as out:
+        writer = csv.writer(out)
+        writer.writerow(['slot', 'player1', 'player2', 'gamelen', 'score1', 'score2'])
+        for slot, ((score1, score2), gamelen) in enumerate(zip(results.scores, results.lengths)):
+            i, j = pairs[slot % len(pairs)]
+            writer.writerow([slot, roster[i][0], roster[j][0], gamelen, score1, score2])
+
+def print_summary(roster, pairs, results):
+    total, moves = [0] * len(roster), [0] * len(roster)
+    for slot, ((score1, score2), gamelen) in enumerate(zip(results.scores, results.lengths)):
+        i, j = pairs[slot % len(pairs)]
+        total[i], moves[i] = total[i] + score1, moves[i] + gamelen
+        total[j], moves[j] = total[j] + score2, moves[j] + gamelen
+    order = sorted(range(len(roster)), key=lambda i: total[i] / max(moves[i], 1), reverse=True)
+    for rank, i in enumerate(order, 1):
+        print(f'{rank:>3}. {roster[i][0]:<24} {total[i] / max(moves[i], 1):.3f} points/move')
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,25 @@
+import importlib
+
+def lazy_module(modname: str, exports: dict[str, list[str]], submodules=()):
+    """build module level __getattr__, __dir__ and __all__ that import submodules on first access
+
+    exports maps submodule path to the names it provides, submodules lists child modules that
+    should be reachable as attributes without an explicit import.
+    """
+    attr_module = {attr: mod for mod, attrs in exports.items() for attr in attrs}
+    submodules = set(submodules)
+
+    def __getattr__(name):
+        if name in attr_module:
+            value = getattr(importlib.import_module(attr_module[name]), name)
+        elif name in submodules:
+            value = importlib.import_module(f'{modname}.{name}')
+        else:
+            raise AttributeError(f"module {modname!r} has no attribute {name!r}")
+        setattr(importlib.import_module(modname), name, value)
+        return value
+
+    def __dir__():
+        return sorted(set(vars(importlib.import_module(modname))) | set(attr_module) | submodules)
+
+    return __getattr__, __dir__, list(attr_module)
@@ -0,0 +1,126 @@
+import statistics
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+import numpy as np
+
+import gt
+
+@dataclass
+class Welford:
+    """running mean and variance for many independent streams of ncol-vectors, merged a batch at a time"""
+    nstream: int
+    ncol: int = 2
+    n: np.ndarray = field(init=False)
+    mean: np.ndarray = field(init=False)
+    m2: np.ndarray = field(init=False)
+
+    def __post_init__(self):
+        self.n = np.zeros(self.nstream, dtype=np.int64)
+        self.mean = np.zeros((self.nstream, self.ncol))
+        self.m2 = np.zeros((self.nstream, self.ncol))
+
+    def update(self, stream: np.ndarray, values: np.ndarray) -> None:
+        """add values[k] to stream[k], batch stats are combined with the parallel (Chan) update"""
+        values = np.asarray(values, dtype=np.float64).reshape(len(stream), self.ncol)
+        nb = np.bincount(stream, minlength=self.nstream)
+        hit = nb > 0
+        sums = np.stack([np.bincount(stream, values[:, c], self.nstream) for c in range(self.ncol)], axis=1)
+        meanb = np.divide(sums, nb[:, None], out=np.zeros_like(sums), where=hit[:, None])
+        dev = (values - meanb[stream])**2
+        m2b = np.stack([np.bincount(stream, dev[:, c], self.nstream) for c in range(self.ncol)], axis=1)
+        n = self.n + nb
+        delta = meanb - self.mean
+        scale = np.divide(nb, n, out=np.zeros(self.nstream), where=n > 0)[:, None]
+        self.m2 += m2b + delta**2 * (self.n[:, None] * scale)
+        self.mean += delta * scale
+        self.n = n
+
+    @property
+    def var(self) -> np.ndarray:
+        """sample variance, inf for streams with fewer than two values"""
+        return np.divide(self.m2, (self.n - 1)[:, None], out=np.full_like(self.m2, np.inf), where=self.n[:, None] > 1)
+
+    def halfwidth(self, confidence: float = 0.95) -> np.ndarray:
+        z = statistics.NormalDist().inv_cdf((1 + confidence) / 2)
+        return z * np.sqrt(self.var / np.maximum(self.n, 1)[:, None])
+
+@dataclass
+class AdaptiveResult:
+    """per-pairing mean payoff per move for (player1, player2), with confidence halfwidths"""
+    pairs: list
+    mean: np.ndarray
+    halfwidth: np.ndarray
+    ngames: np.ndarray
+    converged: np.ndarray
+
+    @property
+    def total_games(self) -> int:
+        return int(self.ngames.sum())
+
+    def payoff_matrix(self) -> np.ndarray:
+        """PxP mean payoff per move of the row strategy against the column strategy"""
+        nplayer = max(max(p) for p in self.pairs) + 1
+        payoffs = np.zeros((nplayer, nplayer))
+        for (i, j), (m1, m2) in zip(self.pairs, self.mean):
+            payoffs[i, j], payoffs[j, i] = m1, m2
+        return payoffs
+
+def adaptive_payoffs(
+    strategies: list[Callable[[], gt.Strategy]],
+    gamelen: int = 100,
+    target_width: float = 0.05,
+    confidence: float = 0.95,
+    batch: int = 16,
+    min_games: int = 4,
+    max_games: int = 100_000,
+    nworkers: Optional[int] = 0,
+    seed: Optional[int] = None,
+    scorer: Optional[gt.GameScorer] = None,
+) -> AdaptiveResult:
+    """estimate all-pairs payoffs per move, stopping each pairing once its confidence interval is narrow
+
+    Repeats are played in batches. A pairing is done once the full width of its confidence interval
+    for both players is below target_width. Each batch goes to the unfinished pairings with the widest
+    intervals first, in proportion to how many more games they need, until max_games is spent.
+    strategies are zero argument factories, eg strategy classes.
+    """
+    scorer = scorer or gt.GameScorer()
+    pairs = [(i, j) for i in range(len(strategies)) for j in range(i + 1)]
+    stats = Welford(len(pairs))
+    played, nbatch = 0, 0
+    while played < max_games:
+        hw = stats.halfwidth(confidence).max(axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # ratio of current to target interval width, a zero width interval counts as done
+            ratio = np.where(stats.n >= min_games, np.nan_to_num(2 * hw / target_width, posinf=np.inf), np.inf)
+            need = np.where(stats.n < min_games, min_games - stats.n, np.ceil(stats.n * (ratio**2 - 1)))
+        active = np.flatnonzero(ratio > 1)
+        if not len(active):
+            break
+        slots = []
+        for k in active[np.argsort(-ratio[active], kind='stable')]:
+            take = int(min(need[k], batch, max_games - played - len(slots)))
+            slots += [k] * max(take, 1)
+            if played + len(slots) >= max_games: break
+        matches = [gt.MatchRunner(strategies[pairs[k][0]](), strategies[pairs[k][1]](), gamelen=gamelen) for k in slots]
+        batch_seed = None if seed is None else (seed, nbatch)
+        results = gt.play_matches_shared(matches, nworkers, seed=batch_seed, scorer=scorer)
+        stats.update(np.array(slots), results.scores / gamelen)
+        played += len(slots)
+        nbatch += 1
+    halfwidth = stats.halfwidth(confidence)
+    converged = (stats.n >= min_games) & (2 * halfwidth.max(axis=1) <= target_width)
+    return AdaptiveResult(pairs, stats.mean.copy(), halfwidth, stats.n.copy(), converged)
+
+def fixed_payoffs(strategies, gamelen=100, ngames=100, nworkers=0, seed=None, scorer=None) -> AdaptiveResult:
+    """the brute force baseline, ngames repeats of every pairing"""
+    return adaptive_payoffs(strategies,
+                            gamelen,
+                            target_width=0,
+                            batch=ngames,
+                            min_games=ngames,
+                            max_games=ngames * len(strategies) * (len(strategies) + 1) // 2,
+                            nworkers=nworkers,
+                            seed=seed,
+                            scorer=scorer)
@@ -1,8 +1,15 @@
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
+import itertools
+import operator
 import random
 import math
+import time
+
+import numpy as np
+
+from gt.runner import metrics
 
 class TourneyType(Enum):
     ROUND_ROBIN = auto()
@@ -10,15 +17,204 @@ class TourneyType(Enum):
     DOUBLE_ELIMINATION = auto()
     SWISS = auto()
 
-@dataclass
+class ColumnTable:
+    """growable struct-of-arrays, one numpy column per field, rows are appended and never removed"""
+
+    def __init__(self, capacity: int = 8, **spec):
+        # spec maps column name to (dtype, fill value)
+        self.spec = spec
+        self.size = 0
+        self.columns = {name: np.full(max(capacity, 1), fill, dtype) for name, (dtype, fill) in spec.items()}
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.columns[name][:self.size]
+
+    def _reserve(self, size: int) -> None:
+        capacity = len(next(iter(self.columns.values())))
+        if size <= capacity:
+            return
+        capacity = max(size, 2 * capacity)
+        for name, (dtype, fill) in self.spec.items():
+            grown = np.full(capacity, fill, dtype)
+            grown[:self.size] = self.columns[name][:self.size]
+            self.columns[name] = grown
+
+    def append(self, **values) -> int:
+        self._reserve(self.size + 1)
+        for name, value in values.items():
+            self.columns[name][self.size] = value
+        self.size += 1
+        return self.size - 1
+
+    def extend(self, n: int, **values) -> np.ndarray:
+        """append n rows at once, values are scalars or length n arrays; returns the new row indices"""
+        self._reserve(self.size + n)
+        rows = np.arange(self.size, self.size + n)
+        for name, value in values.items():
+            self.columns[name][rows] = value
+        self.size += n
+        return rows
+
+def _column(name: str, table: str):
+    """property reading one cell of a ColumnTable row, so views keep the plain attribute api"""
+
+    def get(self):
+        return getattr(self._state, table).columns[name][self._index].item()
+
+    def set(self, value):
+        getattr(self._state, table).columns[name][self._index] = value
+
+    return property(get, set)
+
+PLAYER_COUNTERS = ('score', 'matches_played', 'matches_won', 'matches_lost', 'matches_drawn')
+_NO_COUNTS = (0, ) * len(PLAYER_COUNTERS)
+
+def _player_column(name: str):
+    """like _column, but a player no state has adopted yet keeps its counters in a plain tuple"""
+    k = PLAYER_COUNTERS.index(name)
+
+    def get(self):
+        if self._state is None:
+            return self._counters[k]
+        return self._state.player_table.columns[name][self._index].item()
+
+    def set(self, value):
+        if self._state is None:
+            self._counters = self._counters[:k] + (value, ) + self._counters[k + 1:]
+        else:
+            self._state.player_table.columns[name][self._index] = value
+
+    return property(get, set)
+
+class TourneyState:
+    """struct-of-arrays tournament state; TourneyPlayer and Match objects are thin views onto its rows
+
+    player_table holds score and W/L/D counters, match_table holds match endpoints (indices into
+    players), the winning side (-1 none, 0 player1, 1 player2), draw/completed flags and round number.
+    A player belongs to one state at a time. Only a standalone state, made for a Match between
+    unattached players, gives its players up to another state.
+    """
+
+    def __init__(self, nplayer: int = 8, nmatch: int = 8, standalone: bool = False):
+        self.standalone = standalone
+        self.players: List['TourneyPlayer'] = []
+        self.matches: List['Match'] = []
+        self.player_rows: Dict[str, int] = {}
+        self.player_table = ColumnTable(nplayer, **{name: (np.int64, 0) for name in PLAYER_COUNTERS})
+        self.match_table = ColumnTable(nmatch,
+                                       player1=(np.int64, -1),
+                                       player2=(np.int64, -1),
+                                       winner=(np.int8, -1),
+                                       is_draw=(np.bool_, False),
+                                       completed=(np.bool_, False),
+                                       round_number=(np.int64, 0))
+
+    def add_player(self, player: 'TourneyPlayer') -> None:
+        """move a player's row into this state, the player object becomes a view onto it"""
+        self.add_players([player])
+
+    def add_players(self, players: List['TourneyPlayer']) -> None:
+        """adopt many players; unattached players are copied in one vectorized assignment"""
+        for player in players:
+            if player._state is not None and not player._state.standalone:
+                raise ValueError(f"Player {player.id} already belongs to a tournament")
+        rows = self.player_table.extend(len(players)).tolist()
+        detached, detached_rows, by_source = [], [], {}
+        for row, player in zip(rows, players):
+            source = player._state
+            if source is None:
+                if player._counters is not _NO_COUNTS:
+                    detached.append(player._counters)
+                    detached_rows.append(row)
+            else:
+                # players moving over from standalone matches are copied one source state at a time
+                by_source.setdefault(id(source), (source, [], []))
+                by_source[id(source)][1].append(row)
+                by_source[id(source)][2].append(player._index)
+        if detached:
+            counters = np.array(detached, dtype=np.int64)
+            for k, name in enumerate(PLAYER_COUNTERS):
+                self.player_table.columns[name][detached_rows] = counters[:, k]
+        for source, dest, src in by_source.values():
+            for name in PLAYER_COUNTERS:
+                self.player_table.columns[name][dest] = source.player_table.columns[name][src]
+        for row, player in zip(rows, players):
+            player._state, player._index, player._counters = self, row, None
+            self.player_rows.setdefault(player.id, row)
+        self.players.extend(players)
+
+    def add_match(self, match: 'Match', **values) -> None:
+        match._index = self.match_table.append(**values)
+        match._state = self
+        self.matches.append(match)
+
+    def standings(self) -> np.ndarray:
+        """player indices ordered by (score, matches_won) descending, ties keep player order"""
+        table = self.player_table
+        return np.lexsort((-table['matches_won'], -table['score']))
+
+    def apply_results(self, match_index, winner, is_draw, win_points=1, draw_points=0, loss_points=0) -> None:
+        """vectorized Match.set_result over arrays of match rows; winner is the winning side 0 or 1"""
+        match_index = np.asarray(match_index, dtype=np.int64)
+        winner = np.where(is_draw, -1, winner).astype(np.int8)
+        is_draw = np.asarray(is_draw, dtype=bool)
+        matches, players = self.match_table, self.player_table.columns
+        matches.columns['completed'][match_index] = True
+        matches.columns['is_draw'][match_index] = is_draw
+        matches.columns['winner'][match_index] = winner
+        p1, p2 = matches['player1'][match_index], matches['player2'][match_index]
+        won = np.where(winner == 0, p1, p2)[~is_draw]
+        lost = np.where(winner == 0, p2, p1)[~is_draw]
+        drawn = np.concatenate([p1[is_draw], p2[is_draw]])
+        n = len(self.players)
+        counts = {key: np.bincount(idx, minlength=n) for key, idx in (('won', won), ('lost', lost), ('drawn', drawn))}
+        players['matches_won'][:n] += counts['won']
+        players['matches_lost'][:n] += counts['lost']
+        players['matches_drawn'][:n] += counts['drawn']
+        players['matches_played'][:n] += counts['won'] + counts['lost'] + counts['drawn']
+        players['score'][:n] += win_points * counts['won'] + loss_points * counts['lost'] + draw_points * counts['drawn']
+
 class TourneyPlayer:
-    id: str
-    name: str
-    score: int = 0
-    matches_played: int = 0
-    matches_won: int = 0
-    matches_lost: int = 0
-    matches_drawn: int = 0
+    __slots__ = ('id', 'name', '_state', '_index', '_counters')
+
+    def __init__(self,
+                 id: str,
+                 name: str,
+                 score: int = 0,
+                 matches_played: int = 0,
+                 matches_won: int = 0,
+                 matches_lost: int = 0,
+                 matches_drawn: int = 0):
+        self.id = id
+        self.name = name
+        # counters live in a plain tuple until a TourneyState adopts the player and its row takes over
+        self._state, self._index = None, None
+        counters = (score, matches_played, matches_won, matches_lost, matches_drawn)
+        self._counters = counters if any(counters) else _NO_COUNTS
+
+    @classmethod
+    def create_many(cls, ids: List[str], names: List[str]) -> List['TourneyPlayer']:
+        """build many fresh players, skipping the per-player argument handling of __init__"""
+        players = []
+        for id, name in zip(ids, names):
+            player = cls.__new__(cls)
+            player.id, player.name = id, name
+            player._state, player._index, player._counters = None, None, _NO_COUNTS
+            players.append(player)
+        return players
+
+    score = _player_column('score')
+    matches_played = _player_column('matches_played')
+    matches_won = _player_column('matches_won')
+    matches_lost = _player_column('matches_lost')
+    matches_drawn = _player_column('matches_drawn')
+
+    def __repr__(self):
+        counters = ', '.join(f'{name}={getattr(self, name)}' for name in PLAYER_COUNTERS)
+        return f'TourneyPlayer(id={self.id!r}, name={self.name!r}, {counters})'
 
     def win_match(self, points: int = 1):
         self.matches_played += 1
@@ -35,16 +231,66 @@ class TourneyPlayer:
         self.matches_drawn += 1
         self.score += points
 
-@dataclass
 class Match:
-    id: str
-    player1: TourneyPlayer
-    player2: TourneyPlayer
-    winner: Optional[TourneyPlayer] = None
-    loser: Optional[TourneyPlayer] = None
-    is_draw: bool = False
-    completed: bool = False
-    round_number: int = 0
+    __slots__ = ('id', 'player1', 'player2', '_state', '_index')
+
+    def __init__(self,
+                 id: str,
+                 player1: TourneyPlayer,
+                 player2: TourneyPlayer,
+                 winner: Optional[TourneyPlayer] = None,
+                 loser: Optional[TourneyPlayer] = None,
+                 is_draw: bool = False,
+                 completed: bool = False,
+                 round_number: int = 0):
+        self.id = id
+        self.player1 = player1
+        self.player2 = player2
+        if winner is None and loser is not None:
+            winner = player2 if loser is player1 else player1
+        live = list(dict.fromkeys(p._state for p in (player1, player2) if p._state and not p._state.standalone))
+        if len(live) > 1:
+            raise ValueError(f"Players {player1.id} and {player2.id} belong to different tournaments")
+        state = (live or [player1._state or player2._state])[0]
+        if state is None:
+            state = TourneyState(nplayer=2, nmatch=1, standalone=True)
+        joining = [p for p in dict.fromkeys((player1, player2)) if p._state is not state]
+        if joining:
+            state.add_players(joining)
+        state.add_match(self,
+                        player1=player1._index,
+                        player2=player2._index,
+                        winner=self._side(winner),
+                        is_draw=is_draw,
+                        completed=completed,
+                        round_number=round_number)
+
+    is_draw = _column('is_draw', 'match_table')
+    completed = _column('completed', 'match_table')
+    round_number = _column('round_number', 'match_table')
+    _winner_side = _column('winner', 'match_table')
+
+    def _side(self, player: Optional[TourneyPlayer]) -> int:
+        if player is None: return -1
+        return 0 if player is self.player1 else 1
+
+    @property
+    def winner(self) -> Optional[TourneyPlayer]:
+        side = self._winner_side
+        return None if side < 0 else (self.player1, self.player2)[side]
+
+    @winner.setter
+    def winner(self, player: Optional[TourneyPlayer]):
+        self._winner_side = self._side(player)
+
+    @property
+    def loser(self) -> Optional[TourneyPlayer]:
+        side = self._winner_side
+        return None if side < 0 else (self.player2, self.player1)[side]
+
+    def __repr__(self):
+        return (f'Match(id={self.id!r}, player1={self.player1!r}, player2={self.player2!r}, winner={self.winner!r}, '
+                f'is_draw={self.is_draw}, completed={self.completed}, round_number={self.round_number})')
 
     def set_result(self, winner: Optional[TourneyPlayer] = None, is_draw: bool = False):
         self.completed = True
@@ -57,7 +303,6 @@ class Match:
 
         if winner is not None:
             self.winner = winner
-            self.loser = self.player2 if winner == self.player1 else self.player1
             self.winner.win_match()
             self.loser.lose_match()
 
@@ -79,12 +324,15 @@ class Tourney:
     completed: bool = False
     rankings: List[TourneyPlayer] = field(default_factory=list)
     _match_id_counter: int = field(default=0, init=False)
+    _match_rows: Dict[str, int] = field(default_factory=dict, init=False)
 
     def __post_init__(self):
+        self.state = TourneyState(nplayer=len(self.players))
+        self.state.add_players(self.players)
         if self.config.random_seed is not None:
             random.seed(self.config.random_seed)
         self.strategy = self._get_tournament_strategy()
-        self.strategy.initialize(self)
+        self._pair_round(self.strategy.initialize)
 
     def _get_tournament_strategy(self) -> 'TourneyStrategy':
         if self.config.tournament_type == TourneyType.ROUND_ROBIN:
@@ -106,47 +354,83 @@ class Tourney:
         match_id = self._generate_match_id()
         match = Match(id=match_id, player1=player1, player2=player2, round_number=round_number)
         self.matches.append(match)
+        self._match_rows[match_id] = match._index
         return match
 
     def record_match_result(self,
                             match_id: str,
                             winner_id: Optional[str] = None,
                             is_draw: bool = False) -> None:
-        match = next((m for m in self.matches if m.id == match_id), None)
-        if match is None:
-            raise ValueError(f"Match with ID {match_id} not found")
+        self.record_results([(match_id, winner_id, is_draw)])
 
-        if match.completed:
-            raise ValueError(f"Match {match_id} has already been completed")
+    def record_results(self, batch) -> None:
+        """Record a batch of (match_id, winner_id, is_draw) results.
 
-        if is_draw:
-            match.set_result(is_draw=True)
-            match.player1.draw_match(self.config.draw_points)
-            match.player2.draw_match(self.config.draw_points)
-        else:
-            winner = None
-            if winner_id == match.player1.id:
-                winner = match.player1
-                match.player1.win_match(self.config.win_points)
-                match.player2.lose_match(self.config.loss_points)
-            elif winner_id == match.player2.id:
-                winner = match.player2
-                match.player2.win_match(self.config.win_points)
-                match.player1.lose_match(self.config.loss_points)
-            else:
-                raise ValueError(f"Winner ID {winner_id} does not match either player in the match")
-
-            match.set_result(winner=winner)
+        Ids are translated to match rows and winning sides, then recorded by record_result_rows.
+        The per-result id lookups cost more than recording itself, so for batches of millions of
+        results callers that already know the match rows should call record_result_rows directly.
+        """
+        batch = list(batch)
+        if not batch:
+            return
+        # column views via itemgetter avoid building millions of intermediate tuples
+        match_ids, winner_ids = map(operator.itemgetter(0), batch), map(operator.itemgetter(1), batch)
+        try:
+            index = np.fromiter(map(self._match_rows.__getitem__, match_ids), np.int64, len(batch))
+        except KeyError as e:
+            raise ValueError(f"Match with ID {e.args[0]} not found") from None
+        is_draw = np.fromiter(map(operator.itemgetter(2), batch), bool, len(batch))
+        table = self.state.match_table
+        player_rows = self.state.player_rows
+        winner = np.fromiter(map(player_rows.get, winner_ids, itertools.repeat(-1)), np.int64, len(batch))
+        side = np.where(winner == table['player1'][index], 0, np.where(winner == table['player2'][index], 1, -1))
+        invalid = (side < 0) & ~is_draw
+        if invalid.any():
+            raise ValueError(f"Winner ID {batch[np.argmax(invalid)][1]} does not match either player in the match")
+        self.record_result_rows(index, side, is_draw)
+
+    def record_result_rows(self, match_index, winner, is_draw) -> None:
+        """Record a batch of results given as arrays of match rows, winning sides (0 player1, 1 player2) and draw flags.
+
+        The whole batch is validated before anything is applied. Player counters are then
+        accumulated in one vectorized pass, and round advancement and rankings run once per batch.
+        """
+        index = np.asarray(match_index, dtype=np.int64)
+        winner = np.asarray(winner, dtype=np.int64)
+        is_draw = np.asarray(is_draw, dtype=bool)
+        if not len(index):
+            return
+        table = self.state.match_table
+        outside = (index < 0) | (index >= len(table))
+        if outside.any():
+            raise ValueError(f"Match row {index[np.argmax(outside)]} not found")
+        completed = table['completed'][index]
+        if completed.any():
+            raise ValueError(f"Match {self.state.matches[index[np.argmax(completed)]].id} has already been completed")
+        seen = np.bincount(index, minlength=len(table))
+        if seen.max() > 1:
+            raise ValueError(f"Match {self.state.matches[np.argmax(seen)].id} appears more than once in the batch")
+        invalid = ((winner < 0) | (winner > 1)) & ~is_draw
+        if invalid.any():
+            raise ValueError(f"Winner side {winner[np.argmax(invalid)]} must be 0 or 1 for a decided match")
+
+        self.state.apply_results(index,
+                                 winner,
+                                 is_draw,
+                                 win_points=self.config.win_points,
+                                 draw_points=self.config.draw_points,
+                                 loss_points=self.config.loss_points)
+        if metrics.active: metrics.active.matches.inc(len(index))
 
         # Check if current round is complete and generate next round if needed
-        self.strategy.process_match_result(self, match)
+        self.strategy.process_results(self, index)
 
         # Update rankings
         self.update_rankings()
 
     def update_rankings(self) -> None:
         """Update player rankings based on their scores."""
-        self.rankings = sorted(self.players, key=lambda p: (p.score, p.matches_won), reverse=True)
+        self.rankings = list(map(self.state.players.__getitem__, self.state.standings().tolist()))
 
     def get_upcoming_matches(self) -> List[Match]:
         """Get matches that have not been completed yet."""
@@ -162,8 +446,8 @@ class Tourney:
 
     def check_round_complete(self) -> bool:
         """Check if all matches in the current round have been completed."""
-        current_round_matches = self.get_current_round_matches()
-        return all(match.completed for match in current_round_matches)
+        table = self.state.match_table
+        return bool(np.all(table['completed'][table['round_number'] == self.current_round]))
 
     def advance_to_next_round(self) -> None:
         """Advance the tournament to the next round."""
@@ -174,7 +458,13 @@ class Tourney:
             raise ValueError("Current round is not complete")
 
         self.current_round += 1
-        self.strategy.generate_round(self)
+        self._pair_round(self.strategy.generate_round)
+
+    def _pair_round(self, pair) -> None:
+        """run pair(self) to create a round's matches, timed into the active metrics registry"""
+        start = time.perf_counter()
+        pair(self)
+        if metrics.active: metrics.active.round_seconds.observe(time.perf_counter() - start)
 
     def get_player_by_id(self, player_id: str) -> Optional[TourneyPlayer]:
         """Get a player by their ID."""
@@ -193,53 +483,103 @@ class TourneyStrategy:
 
     def process_match_result(self, tournament: Tourney, match: Match) -> None:
         """Process a match result and determine if tournament should advance."""
+        self.process_results(tournament, np.array([match._index]))
+
+    def process_results(self, tournament: Tourney, match_index: np.ndarray) -> None:
+        """Process a batch of results, given as match rows, advancing at most one round."""
         if tournament.check_round_complete():
             if self.is_tournament_complete(tournament):
                 tournament.completed = True
             else:
                 # Auto-advance to next round
                 tournament.current_round += 1
-                self.generate_round(tournament)
+                tournament._pair_round(self.generate_round)
 
     def is_tournament_complete(self, tournament: Tourney) -> bool:
         """Determine if the tournament is complete."""
         return False
 
-class RoundRobinStrategy(TourneyStrategy):
-    """Round robin tournament where each player plays against every other player once."""
-
-    def initialize(self, tournament: Tourney) -> None:
-        # Generate all matches in advance
-        players = tournament.players.copy()
-        round_num = 1
-
-        # If odd number of players, each round one player gets a bye
-        if len(players) % 2 == 1:
-            players.append(None)  # Add a dummy player for pairing
-
-        n = len(players)
-        for _ in range(n - 1):
-            # Generate matches for this round
-            for i in range(n // 2):
-                player1 = players[i]
-                player2 = players[n - 1 - i]
+class RoundRobinSchedule:
+    """circle-method round robin schedule computed arithmetically, any pairing is O(1) to look up
+
+    Matches the classic construction of fixing the first player and rotating the rest one seat per
+    round. With an odd number of players a dummy seat is added and whoever draws it has a bye.
+    Rounds and slots are 0-based; pairings are (index, index) into the player list.
+    """
+
+    def __init__(self, nplayer: int):
+        self.nplayer = nplayer
+        self.nseat = nplayer + nplayer % 2
+        self.nrounds = max(self.nseat - 1, 0)
+        self.matches_per_round = nplayer // 2
+
+    def seat(self, round_number: int, position: int) -> int:
+        """player index sitting at position in the given round"""
+        if position == 0:
+            return 0
+        return 1 + (position - 1 - round_number) % (self.nseat - 1)
+
+    def bye_slot(self, round_number: int) -> Optional[int]:
+        if self.nseat == self.nplayer:
+            return None
+        position = 1 + (self.nseat - 2 + round_number) % (self.nseat - 1)
+        return min(position, self.nseat - 1 - position)
+
+    def pairing(self, round_number: int, slot: int) -> Tuple[int, int]:
+        """the slot-th real match of a round, byes are skipped"""
+        if not (0 <= round_number < self.nrounds and 0 <= slot < self.matches_per_round):
+            raise IndexError(f"no match at round {round_number} slot {slot}")
+        bye = self.bye_slot(round_number)
+        if bye is not None and slot >= bye:
+            slot += 1
+        return self.seat(round_number, slot), self.seat(round_number, self.nseat - 1 - slot)
+
+    def round(self, round_number: int):
+        return (self.pairing(round_number, slot) for slot in range(self.matches_per_round))
+
+    def __len__(self):
+        return self.nrounds * self.matches_per_round
+
+    def __getitem__(self, index: int) -> Tuple[int, int]:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f"schedule index {index} out of range")
+        return self.pairing(*divmod(index, self.matches_per_round))
+
+    def __iter__(self):
+        for round_number in range(self.nrounds):
+            yield from self.round(round_number)
 
-                # Skip if one player is the dummy player (None)
-                if player1 is not None and player2 is not None:
-                    tournament.create_match(player1, player2, round_num)
+class RoundRobinStrategy(TourneyStrategy):
+    """Round robin tournament where each player plays against every other player once.
 
-            round_num += 1
+    Matches are only created for a round once it becomes active, pairings come from a RoundRobinSchedule.
+    """
 
-            # Rotate players for next round (first player stays fixed)
-            players.insert(1, players.pop())
+    def initialize(self, tournament: Tourney) -> None:
+        self.schedule = RoundRobinSchedule(len(tournament.players))
+        self.last_round = 0
+        # round numbers are 1-based, start there so completing round 1 advances to round 2
+        tournament.current_round = 1
+        self._create_round(tournament, 1)
+
+    def _create_round(self, tournament: Tourney, round_num: int) -> None:
+        # round numbers are 1-based for round robin
+        if round_num <= self.last_round or round_num > self.schedule.nrounds:
+            return
+        self.last_round = round_num
+        for i, j in self.schedule.round(round_num - 1):
+            tournament.create_match(tournament.players[i], tournament.players[j], round_num)
 
     def is_tournament_complete(self, tournament: Tourney) -> bool:
-        # Tourney is complete when all matches are completed
+        # Tourney is complete when every round has been created and all matches are completed
+        if self.last_round < self.schedule.nrounds:
+            return False
         return all(match.completed for match in tournament.matches)
 
     def generate_round(self, tournament: Tourney) -> None:
-        # All matches are generated during initialization
-        pass
+        self._create_round(tournament, tournament.current_round)
 
 class SingleEliminationStrategy(TourneyStrategy):
     """Single elimination tournament where losers are eliminated."""
@@ -272,10 +612,11 @@ class SingleEliminationStrategy(TourneyStrategy):
     def generate_round(self, tournament: Tourney) -> None:
         # Get winners from previous round
         previous_round = tournament.current_round - 1
-        winners = [
-            match.winner for match in tournament.matches
-            if match.round_number == previous_round and match.completed
-        ]
+        state, table = tournament.state, tournament.state.match_table
+        rows = np.flatnonzero((table['round_number'] == previous_round) & table['completed'])
+        side = table['winner'][rows]
+        winner_rows = np.where(side == 0, table['player1'][rows], table['player2'][rows])
+        winners = [state.players[p] if s >= 0 else None for s, p in zip(side.tolist(), winner_rows.tolist())]
 
         # Pair winners for next round
         for i in range(0, len(winners), 2):
@@ -313,7 +654,12 @@ class DoubleEliminationStrategy(TourneyStrategy):
     def _is_power_of_two(self, n: int) -> bool:
         return n > 0 and (n & (n - 1)) == 0
 
-    def process_match_result(self, tournament: Tourney, match: Match) -> None:
+    def process_results(self, tournament: Tourney, match_index: np.ndarray) -> None:
+        for i in match_index:
+            self._update_brackets(tournament, tournament.state.matches[i])
+        super().process_results(tournament, match_index)
+
+    def _update_brackets(self, tournament: Tourney, match: Match) -> None:
         # Update brackets based on match result
         if match.winner is not None and match.loser is not None:
             # Add winner to winners bracket if not already there
@@ -329,8 +675,6 @@ class DoubleEliminationStrategy(TourneyStrategy):
                 tournament.losers_bracket.remove(match.loser)
                 tournament.eliminated.append(match.loser)
 
-        super().process_match_result(tournament, match)
-
     def generate_round(self, tournament: Tourney) -> None:
         # Logic for generating matches in both winners and losers brackets
         # This is simplified - real implementation would be more complex
@@ -0,0 +1,161 @@
+import math
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+from gt.ai_tourney import TourneyType
+
+@dataclass
+class BracketSimResult:
+    """finish-position histogram from many simulated tournaments
+
+    counts[i, k] is the number of tournaments in which player i finished in place k (0 is the winner).
+    For elimination brackets places are grouped by the round a player went out in, so place k holds
+    everyone eliminated k rounds before the final.
+    """
+    tournament_type: TourneyType
+    counts: np.ndarray
+    ntourney: int
+
+    @property
+    def probs(self) -> np.ndarray:
+        return self.counts / self.ntourney
+
+    @property
+    def win_prob(self) -> np.ndarray:
+        return self.probs[:, 0]
+
+    @property
+    def expected_place(self) -> np.ndarray:
+        return self.probs @ np.arange(self.counts.shape[1])
+
+def winprob_from_payoffs(payoffs, temperature: Optional[float] = None) -> np.ndarray:
+    """convert a PxP matrix of mean GameScorer payoffs (row player's score vs column) to win probabilities
+
+    With no temperature the higher payoff wins outright and equal payoffs are a coin flip. With a
+    temperature the win probability is logistic in the payoff difference.
+    """
+    payoffs = np.asarray(payoffs, dtype=np.float64)
+    diff = payoffs - payoffs.T
+    if temperature is None:
+        return (diff > 0) + 0.5 * (diff == 0)
+    return 1 / (1 + np.exp(-diff / temperature))
+
+def simulate_tournaments(
+    winprob,
+    tournament_type: TourneyType = TourneyType.SINGLE_ELIMINATION,
+    ntourney: int = 10_000,
+    seed: Optional[int] = None,
+    shuffle: bool = False,
+    chunk: int = 0,
+    win_points: int = 3,
+    draw_points: int = 1,
+    loss_points: int = 0,
+    swiss_rounds: int = 5,
+) -> BracketSimResult:
+    """replay ntourney tournaments at once over numpy bracket state
+
+    winprob[i, j] is the probability player i beats player j. For round robin and swiss,
+    1 - winprob[i, j] - winprob[j, i] is the draw probability. Elimination brackets are seeded by
+    index in the standard nested layout (1 v N, 2 v N-1, ...), so player 0 is the top seed, takes the
+    first bye and can only meet player 1 in the final. With shuffle set, every replay draws a fresh
+    random bracket like SingleEliminationStrategy does.
+    """
+    winprob = np.asarray(winprob, dtype=np.float64)
+    if winprob.ndim != 2 or winprob.shape[0] != winprob.shape[1]:
+        raise ValueError(f"winprob must be a square matrix, got shape {winprob.shape}")
+    rng = np.random.default_rng(seed)
+    nplayer = len(winprob)
+    if tournament_type == TourneyType.SINGLE_ELIMINATION:
+        kernel, nplace, cost = _single_elimination, math.ceil(math.log2(max(nplayer, 2))) + 1, nplayer
+    elif tournament_type == TourneyType.ROUND_ROBIN:
+        kernel, nplace, cost = _round_robin, nplayer, nplayer * nplayer // 2
+    elif tournament_type == TourneyType.SWISS:
+        kernel, nplace, cost = _swiss, nplayer, nplayer
+    else:
+        raise ValueError(f"Unsupported tournament type: {tournament_type}")
+    # bound the working set to a few million bracket entries per chunk
+    chunk = chunk or max(1, 2**22 // max(cost, 1))
+    points = (win_points, draw_points, loss_points)
+    counts = np.zeros((nplayer, nplace), dtype=np.int64)
+    for start in range(0, ntourney, chunk):
+        k = min(chunk, ntourney - start)
+        places = kernel(winprob, k, rng, shuffle, points=points, swiss_rounds=swiss_rounds)
+        player = np.broadcast_to(np.arange(nplayer), places.shape)
+        counts += np.bincount((player * nplace + places).ravel(), minlength=nplayer * nplace).reshape(counts.shape)
+    return BracketSimResult(tournament_type, counts, ntourney)
+
+def _seed_order(nplayer, k, rng, shuffle):
+    if not shuffle:
+        return np.broadcast_to(np.arange(nplayer), (k, nplayer))
+    return np.argsort(rng.random((k, nplayer)), axis=1)
+
+def _bracket_seeds(slots):
+    """seed at each bracket slot, nested so that seeds s and slots - 1 - s meet in round one"""
+    seeds = np.zeros(1, dtype=np.int64)
+    while len(seeds) < slots:
+        seeds = np.stack([seeds, 2 * len(seeds) - 1 - seeds], axis=1).ravel()
+    return seeds
+
+def _single_elimination(winprob, k, rng, shuffle, **_):
+    """bracket state is a (k, slots) array of player indices; the phantom index nplayer always loses"""
+    nplayer = len(winprob)
+    nround = math.ceil(math.log2(max(nplayer, 2)))
+    slots = 2**nround
+    padded = np.zeros((nplayer + 1, nplayer + 1))
+    padded[:nplayer, :nplayer] = winprob
+    padded[:nplayer, nplayer] = 1
+    # seeds past the last player are phantoms, so the top seeds get the byes
+    order = np.concatenate([_seed_order(nplayer, k, rng, shuffle), np.full((k, slots - nplayer), nplayer)], axis=1)
+    state = order[:, _bracket_seeds(slots)].astype(np.min_scalar_type(nplayer))
+    places = np.zeros((k, nplayer + 1), dtype=np.int64)
+    rows = np.arange(k)[:, None]
+    for rnd in range(nround):
+        a, b = state[:, 0::2], state[:, 1::2]
+        awins = rng.random(a.shape) < padded[a, b]
+        state = np.where(awins, a, b)
+        places[rows, np.where(awins, b, a)] = nround - rnd
+    return places[:, :nplayer]
+
+def _rank_places(score, rng):
+    """place of each player by descending score, ties broken at random"""
+    k, nplayer = score.shape
+    order = np.lexsort((rng.random(score.shape), -score), axis=1)
+    places = np.empty_like(order)
+    np.put_along_axis(places, order, np.arange(nplayer)[None].repeat(k, 0), axis=1)
+    return places
+
+def _play(winprob, a, b, rng, points):
+    """score a batch of pairings a vs b, returns points for a and b"""
+    win, draw, loss = points
+    u = rng.random(a.shape)
+    awins = u < winprob[a, b]
+    bwins = u >= 1 - winprob[b, a]
+    drawn = ~awins & ~bwins
+    return (np.where(awins, win, np.where(drawn, draw, loss)), np.where(bwins, win, np.where(drawn, draw, loss)))
+
+def _round_robin(winprob, k, rng, shuffle, points, **_):
+    nplayer = len(winprob)
+    i, j = np.triu_indices(nplayer, 1)
+    a, b = np.broadcast_to(i, (k, len(i))), np.broadcast_to(j, (k, len(j)))
+    pa, pb = _play(winprob, a, b, rng, points)
+    offset = np.arange(k)[:, None] * nplayer
+    score = np.bincount((offset + a).ravel(), weights=pa.ravel(), minlength=k * nplayer)
+    score += np.bincount((offset + b).ravel(), weights=pb.ravel(), minlength=k * nplayer)
+    return _rank_places(score.reshape(k, nplayer), rng)
+
+def _swiss(winprob, k, rng, shuffle, points, swiss_rounds, **_):
+    """swiss pairing approximated as adjacent pairs in the standings, rematches are not avoided"""
+    nplayer = len(winprob)
+    score = np.zeros((k, nplayer))
+    rows = np.arange(k)[:, None]
+    standing = _seed_order(nplayer, k, rng, True)
+    for _ in range(swiss_rounds):
+        npair = nplayer // 2
+        a, b = standing[:, 0:2 * npair:2], standing[:, 1:2 * npair:2]
+        pa, pb = _play(winprob, a, b, rng, points)
+        score[rows, a] += pa
+        score[rows, b] += pb
+        standing = np.lexsort((rng.random(score.shape), -score), axis=1)
+    return _rank_places(score, rng)
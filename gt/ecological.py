@@ -0,0 +1,93 @@
+from dataclasses import dataclass, field
+from typing import Optional
+
+import numpy as np
+
+import gt
+from gt.sweep import StrategySpec, play_pairings
+
+# outcome columns as seen by the other player, CD and DC trade places
+_SWAP = [0, 2, 1, 3]
+
+@dataclass
+class EcologyResult:
+    """population share of each strategy per generation, populations[0] is the starting mix"""
+    labels: list
+    populations: np.ndarray
+
+    @property
+    def final(self) -> dict:
+        return dict(zip(self.labels, self.populations[-1].tolist()))
+
+    def survivors(self, threshold: float = 1e-3) -> list:
+        return [label for label, share in self.final.items() if share >= threshold]
+
+@dataclass
+class EcologicalTournament:
+    """Axelrod's ecological tournament over the all-pairs round robin of gt.tourney.AllPairs
+
+    Every pairing, self-play included, is played nrepeat times once and kept as mean outcome
+    counts, counts[i, j] being CC/CD/DC/DD from strategy i's side. Generations are then just
+    matrix-vector products with the payoff matrix. add() plays only the new strategy's row and
+    column, and with a cache file (shared with gt.sweep) games played in earlier runs are reused.
+    strategies are StrategySpecs or strategy class names.
+    """
+    strategies: list
+    gamelen: int | tuple[int, int] = 100
+    nrepeat: int = 1
+    payoff: dict = field(default_factory=gt.default_payoff)
+    seed: int = 0
+    nworkers: Optional[int] = 0
+    cache: Optional[str] = None
+    progress: bool = False
+    nplayed: int = field(default=0, init=False)
+
+    def __post_init__(self):
+        roster, self.strategies = self.strategies, []
+        self.counts = np.zeros((0, 0, len(gt.OUTCOMES)))
+        self.add(*roster)
+
+    @property
+    def labels(self) -> list:
+        return [spec.label for spec in self.strategies]
+
+    def add(self, *strategies) -> None:
+        """extend the roster, playing only pairings that involve a new strategy"""
+        new = [s if isinstance(s, StrategySpec) else StrategySpec(s) for s in strategies]
+        old = len(self.strategies)
+        self.strategies += new
+        pairs = [(i, j) for i in range(old, len(self.strategies)) for j in range(i + 1)]
+        if not pairs:
+            return
+        gamelen = self.gamelen if isinstance(self.gamelen, int) else tuple(self.gamelen)
+        keys = [(self.strategies[i], self.strategies[j], gamelen, repeat) for i, j in pairs
+                for repeat in range(self.nrepeat)]
+        counts, nplayed = play_pairings(keys, self.seed, self.nworkers, self.cache, self.progress)
+        self.nplayed += nplayed
+        mean = counts.reshape(len(pairs), self.nrepeat, -1).mean(axis=1)
+        grown = np.zeros((len(self.strategies), len(self.strategies), len(gt.OUTCOMES)))
+        grown[:old, :old] = self.counts
+        for (i, j), c in zip(pairs, mean):
+            if i == j:
+                c = (c + c[_SWAP]) / 2
+            grown[i, j], grown[j, i] = c, c[_SWAP]
+        self.counts = grown
+
+    @property
+    def payoffs(self) -> np.ndarray:
+        """mean score per game of the row strategy against the column strategy"""
+        return self.counts @ np.array([self.payoff[k][0] for k in gt.OUTCOMES], dtype=np.float64)
+
+    def run(self, ngeneration: int = 1000, weights=None) -> EcologyResult:
+        """reweight the population each generation by its score against the current mix
+
+        weights is the starting share of each strategy, uniform by default.
+        """
+        payoffs = self.payoffs
+        populations = np.empty((ngeneration + 1, len(self.strategies)))
+        populations[0] = np.ones(len(self.strategies)) if weights is None else weights
+        populations[0] /= populations[0].sum()
+        for gen in range(ngeneration):
+            share = populations[gen] * (payoffs @ populations[gen])
+            populations[gen + 1] = share / share.sum()
+        return EcologyResult(self.labels, populations)
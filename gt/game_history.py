@@ -1,7 +1,9 @@
+import collections
+import functools
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class HistoryEntry:
     move1: str
     move2: str
@@ -13,9 +15,15 @@ class HistoryEntry:
 @dataclass
 class GameHistory:
     history: list[HistoryEntry] = field(default_factory=list)
+    defections: list[int] = field(default_factory=lambda: [0, 0], init=False)
+
+    def __post_init__(self):
+        self.defections = [sum(x.move1 == 'D' for x in self.history), sum(x.move2 == 'D' for x in self.history)]
 
     def add_moves(self, move1: str, move2: str):
         self.history.append(HistoryEntry(move1, move2))
+        self.defections[0] += move1 == 'D'
+        self.defections[1] += move2 == 'D'
 
     def __getitem__(self, i):
         return self.history[i]
@@ -28,3 +36,120 @@ class GameHistory:
 
     def __len__(self):
         return len(self.history)
+
+class RecentHistory:
+    """the last `lookback` moves of a game plus running aggregates, so memory is O(lookback) not O(gamelen)
+
+    Reads the same way as GameHistory for the recent window (history[-1], history[-n:], len, bool).
+    Older moves are gone, whole-game questions go through defections and outcome_counts.
+    """
+
+    def __init__(self, lookback: int = 0):
+        self.recent = collections.deque(maxlen=lookback)
+        self.nmoves = 0
+        self.outcome_counts = dict(CC=0, CD=0, DC=0, DD=0)
+
+    @property
+    def lookback(self) -> int:
+        return self.recent.maxlen
+
+    def add_moves(self, move1: str, move2: str):
+        if self.recent.maxlen:
+            self.recent.append(HistoryEntry(move1, move2))
+        self.nmoves += 1
+        self.outcome_counts[move1 + move2] += 1
+
+    @property
+    def defections(self) -> list[int]:
+        counts = self.outcome_counts
+        return [counts['DC'] + counts['DD'], counts['CD'] + counts['DD']]
+
+    def __getitem__(self, i):
+        if isinstance(i, int) and -len(self.recent) <= i < 0:
+            return self.recent[i]  # the common history[-k] read
+        first = self.nmoves - len(self.recent)
+        if isinstance(i, slice):
+            start, stop, step = i.indices(self.nmoves)
+            if start < first and start < stop:
+                raise IndexError(f'move {start} is older than the {self.lookback} move lookback')
+            return [self.recent[k - first] for k in range(start, stop, step)]
+        if i < 0:
+            i += self.nmoves
+        if not first <= i < self.nmoves:
+            raise IndexError(f'move {i} is outside the {self.lookback} move lookback of a {self.nmoves} move game')
+        return self.recent[i - first]
+
+    def __iter__(self):
+        raise TypeError(f'RecentHistory keeps only the last {self.lookback} moves and cannot replay the game, '
+                        'use defections or outcome_counts')
+
+    def __bool__(self):
+        return self.nmoves > 0
+
+    def __len__(self):
+        return self.nmoves
+
+class ArrayHistory:
+    """a finished game held as a (2, nmoves) int8 array, 0 cooperate and 1 defect, as the compiled backend returns it
+
+    Reads like GameHistory (len, indexing, iteration) without keeping an object per move.
+    """
+
+    def __init__(self, moves):
+        self.moves = moves
+
+    @property
+    def history(self) -> list[HistoryEntry]:
+        return [HistoryEntry('CD'[m1], 'CD'[m2]) for m1, m2 in self.moves.T.tolist()]
+
+    @property
+    def defections(self) -> list[int]:
+        return self.moves.sum(axis=1).tolist()
+
+    @functools.cached_property
+    def outcome_counts(self) -> dict[str, int]:
+        codes = 2 * self.moves[0] + self.moves[1]
+        return {k: int((codes == code).sum()) for code, k in enumerate(('CC', 'CD', 'DC', 'DD'))}
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return self.history[i]
+        m1, m2 = self.moves[:, i].tolist()
+        return HistoryEntry('CD'[m1], 'CD'[m2])
+
+    def __iter__(self):
+        return iter(self.history)
+
+    def __bool__(self):
+        return self.moves.shape[1] > 0
+
+    def __len__(self):
+        return self.moves.shape[1]
+
+class MoveFileSink:
+    """streams every move of a game to a file, two bytes per move like b'CD'"""
+
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, 'wb')
+
+    def __call__(self, move1: str, move2: str):
+        self.file.write((move1 + move2).encode())
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def read_moves(path) -> GameHistory:
+    """load a game written by MoveFileSink back into a GameHistory"""
+    with open(path, 'rb') as inp:
+        data = inp.read().decode()
+    history = GameHistory()
+    for k in range(0, len(data), 2):
+        history.add_moves(data[k], data[k + 1])
+    return history
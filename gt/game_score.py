@@ -1,15 +1,41 @@
+from dataclasses import dataclass, field
+
+OUTCOMES = ('CC', 'CD', 'DC', 'DD')
+
+def default_payoff():
+    return dict(
+        CC=(3, 3),
+        CD=(0, 5),
+        DC=(5, 0),
+        DD=(1, 1),
+    )
+
+def count_outcomes(moves):
+    """number of CC, CD, DC and DD rounds in a game, in OUTCOMES order"""
+    if hasattr(moves, 'outcome_counts'):  # RecentHistory and ArrayHistory keep their own counts
+        return tuple(moves.outcome_counts[k] for k in OUTCOMES)
+    counts = dict.fromkeys(OUTCOMES, 0)
+    for move1, move2 in moves:
+        counts[move1 + move2] += 1
+    return tuple(counts[k] for k in OUTCOMES)
+
+@dataclass
 class GameScorer:
+    payoff: dict = field(default_factory=default_payoff)
 
     def score_game(self, moves):
+        if hasattr(moves, 'outcome_counts'):
+            return self.score_counts(count_outcomes(moves))
         p1_score = 0
         p2_score = 0
 
-        score = dict(
-            CC=(3, 3),
-            CD=(0, 5),
-            DC=(5, 0),
-            DD=(1, 1),
-        )
+        score = self.payoff
         for move1, move2 in moves:
                 p1_score, p2_score = p1_score + score[move1 + move2][0], p2_score + score[move1 + move2][1]
         return (p1_score, p2_score)
+
+    def score_counts(self, counts):
+        """score a game from its outcome counts (see count_outcomes) without replaying the moves"""
+        p1_score = sum(n * self.payoff[k][0] for k, n in zip(OUTCOMES, counts))
+        p2_score = sum(n * self.payoff[k][1] for k, n in zip(OUTCOMES, counts))
+        return (p1_score, p2_score)
@@ -1 +1,12 @@
-from gt.runner.match_runner import *
+from gt._lazy import lazy_module
+
+__getattr__, __dir__, __all__ = lazy_module(
+    __name__,
+    {
+        'gt.runner.match_runner': ['MatchRunner'],
+        'gt.runner.metrics': ['MetricsRegistry', 'set_metrics'],
+        'gt.runner.progress': ['Progress'],
+        'gt.runner.shared': ['SharedMatchResults', 'MatchSchedule', 'play_matches_shared', 'MOVE_BITS', 'BIT_MOVES'],
+    },
+    submodules=['jit', 'match_runner', 'metrics', 'progress', 'shared'],
+)
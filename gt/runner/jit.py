@@ -0,0 +1,110 @@
+import functools
+import os
+import random
+from typing import Callable, Optional
+
+import numpy as np
+
+import gt
+
+NSTATE = 4  # float64 scratch slots each kernel gets for the length of a game
+
+def accelerated() -> bool:
+    """true when numba is importable and not switched off with GT_DISABLE_JIT=1"""
+    return _numba() is not None
+
+def _numba():
+    if os.environ.get('GT_DISABLE_JIT', '0') not in ('', '0'):
+        return None
+    try:
+        import numba
+    except ImportError:
+        return None
+    return numba
+
+_compiled = {}
+
+def compile_kernel(kernel: Callable) -> Optional[Callable]:
+    """numba compiled version of a strategy kernel, or None without numba
+
+    Kernels are compiled as C callbacks for one fixed signature and handed to the game loop as typed
+    function pointers, so the loop is compiled once for every pairing. Both are cached on disk next
+    to their modules, so only the first process to use a kernel pays for compilation.
+    """
+    numba = _numba()
+    if numba is None:
+        return None
+    if kernel not in _compiled:
+        _compiled[kernel] = numba.cfunc(_signatures(numba)[0], cache=True)(kernel)
+    return _compiled[kernel]
+
+def compiled_game_loop() -> Optional[Callable]:
+    """the compiled game_loop's entry point, or None without numba
+
+    Calling the entry point for the loop's one signature skips the dispatcher's per-call type
+    resolution, which would otherwise cost more than a short game.
+    """
+    numba = _numba()
+    if numba is None:
+        return None
+    if game_loop not in _compiled:
+        signature = _signatures(numba)[1]
+        loop = numba.njit(signature, cache=True)(game_loop)
+        _compiled[game_loop] = loop.overloads[signature.args].entry_point
+    return _compiled[game_loop]
+
+def _signatures(numba):
+    """(kernel, game loop) numba signatures"""
+    types = numba.types
+    kernel = types.int64(types.int8[:], types.int8[:], types.int64, types.float64, types.float64[:],
+                         types.float64[:])
+    func = types.FunctionType(kernel)
+    loop = types.int8[:, :](func, func, types.int64, types.float64[:, :], types.float64[:], types.float64[:])
+    return kernel, loop
+
+def game_loop(kernel1, kernel2, gamelen, u, params1, params2):
+    """play a game between two kernels, returns the (2, gamelen) int8 moves"""
+    moves = np.zeros((2, gamelen), dtype=np.int8)
+    state1, state2 = np.zeros(NSTATE), np.zeros(NSTATE)
+    for n in range(gamelen):
+        move1 = kernel1(moves[0], moves[1], n, u[0, n], params1, state1)
+        move2 = kernel2(moves[1], moves[0], n, u[1, n], params2, state2)
+        moves[0, n] = move1
+        moves[1, n] = move2
+    return moves
+
+def kernel_of(player) -> Optional[Callable]:
+    """the kernel of a strategy, or of the strategy wrapped by a tourney Player
+
+    A subclass that overrides compute_move but not kernel gets None, the inherited kernel would be stale.
+    """
+    cls = type(getattr(player, 'strategy', player))
+    owner = next(c for c in cls.__mro__ if 'kernel' in vars(c))
+    return cls.kernel if cls.compute_move is owner.compute_move else None
+
+def play_kernels(player1, player2, gamelen: int, compiled: bool = True) -> np.ndarray:
+    """play two kernel strategies, compiled or as plain python; random draws come from the random module"""
+    strategy1, strategy2 = getattr(player1, 'strategy', player1), getattr(player2, 'strategy', player2)
+    kernel1, kernel2, loop = kernel_of(player1), kernel_of(player2), game_loop
+    if compiled:
+        kernel1, kernel2, loop = compile_kernel(kernel1), compile_kernel(kernel2), compiled_game_loop()
+    params1, params2 = _params(strategy1.kernel_params()), _params(strategy2.kernel_params())
+    return loop(kernel1, kernel2, gamelen, _uniforms(gamelen), params1, params2)
+
+@functools.lru_cache(maxsize=1024)
+def _params(params: tuple) -> np.ndarray:
+    """kernel parameter array, shared by every game of strategies with the same parameters"""
+    params = np.array(params, dtype=np.float64)
+    params.flags.writeable = False
+    return params
+
+def _uniforms(gamelen: int) -> np.ndarray:
+    """(2, gamelen) uniform draws in [0, 1) from the random module's stream, 53 bits each"""
+    bits = np.frombuffer(random.randbytes(16 * gamelen), dtype=np.uint64) >> 11
+    return (bits * 2.0**-53).reshape(2, gamelen)
+
+def play_compiled(player1, player2, gamelen: int) -> Optional[gt.ArrayHistory]:
+    """play a game on the compiled backend, None if numba is missing or either strategy has no kernel"""
+    if not accelerated() or kernel_of(player1) is None or kernel_of(player2) is None:
+        return None
+    return gt.ArrayHistory(play_kernels(player1, player2, gamelen))
@@ -1,6 +1,9 @@
 import dataclasses
+import time
+from typing import Callable, Optional
 
 import gt
+from gt.runner import metrics
 
 
 @dataclasses.dataclass
@@ -9,15 +12,54 @@ class MatchRunner:
     player2: gt.Strategy
     history: gt.GameHistory = dataclasses.field(default_factory=gt.GameHistory)
     gamelen: int|str = 100
+    stream: bool = False
+    sink: Optional[Callable[[str, str], None]] = None
+    jit: bool = False
 
     def get_game_girth(self) -> int:
         return int(self.gamelen)
 
     def play(self):
+        """play the game and return its history
+
+        With stream=True the runner and every strategy that declares a lookback keep only a
+        RecentHistory ring buffer plus running aggregates, so memory does not grow with gamelen.
+        The complete game can still be captured by passing a sink, called as sink(move1, move2).
+
+        With jit=True and both strategies providing a kernel, the game is played by compiled code
+        (see gt.runner.jit) and returned as an ArrayHistory; the strategies' own histories are not
+        updated. Without numba, a missing kernel or a sink, play falls back to compute_move. The
+        compiled game holds every move, so stream takes precedence over jit.
+
+        Finished matches are recorded in the active gt.runner.metrics registry, if there is one.
+        """
+        start = time.perf_counter()
+        history = self._play()
+        if metrics.active: metrics.active.finish_match(start, len(history))
+        return history
+
+    def _play(self):
+        if self.jit and not self.sink and not self.stream:
+            from gt.runner.jit import play_compiled
+            history = play_compiled(self.player1, self.player2, self.get_game_girth())
+            if history is not None:
+                self.history = history
+                return history
+        if self.stream:
+            self._use_recent_histories()
         for _ in range(self.get_game_girth()):
             move1 = self.player1.move()
             move2 = self.player2.move()
             self.player1.record_other_player_move(move2)
             self.player2.record_other_player_move(move1)
             self.history.add_moves(move1, move2)
+            if self.sink: self.sink(move1, move2)
         return self.history
+
+    def _use_recent_histories(self):
+        if not self.history:
+            self.history = gt.RecentHistory()
+        for player in (self.player1, self.player2):
+            strategy = getattr(player, 'strategy', player)
+            if strategy.lookback is not None and not strategy.history:
+                strategy.history = gt.RecentHistory(strategy.lookback)
@@ -0,0 +1,150 @@
+import atexit
+import bisect
+import json
+import os
+import time
+from typing import Optional
+
+# half-decade buckets from 1us to 10s
+SECONDS_BUCKETS = tuple(float(f'{10**(k / 2):.3g}') for k in range(-12, 3))
+
+class Counter:
+    __slots__ = ('name', 'help', 'value')
+    kind = 'counter'
+
+    def __init__(self, name, help=''):
+        self.name, self.help, self.value = name, help, 0
+
+    def inc(self, n=1):
+        self.value += n
+
+    def snapshot(self):
+        return self.value
+
+class Gauge(Counter):
+    __slots__ = ()
+    kind = 'gauge'
+
+    def set(self, value):
+        self.value = value
+
+class Histogram:
+    """fixed bucket histogram, counts[k] is the number of values <= bounds[k] and > bounds[k-1]"""
+    __slots__ = ('name', 'help', 'bounds', 'counts', 'sum', 'count')
+    kind = 'histogram'
+
+    def __init__(self, name, help='', bounds=SECONDS_BUCKETS):
+        self.name, self.help, self.bounds = name, help, tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.sum, self.count = 0.0, 0
+
+    def observe(self, value, n=1):
+        self.counts[bisect.bisect_left(self.bounds, value)] += n
+        self.sum += value * n
+        self.count += n
+
+    def snapshot(self):
+        return dict(bounds=list(self.bounds), counts=list(self.counts), sum=self.sum, count=self.count)
+
+class MetricsRegistry:
+    """counters, gauges and histograms for running games, exported as json lines or a prometheus text file
+
+    The standard metrics are attributes: matches, moves, match_seconds (per-match wall time, one in
+    every `sample` matches, the chunk average for matches played in worker processes), round_seconds
+    (time to pair a tournament round) and queue_depth (chunks handed to worker processes and not yet
+    finished). With a path, export() runs by itself at most every interval seconds, checked by
+    maybe_export as sampled matches or worker chunks finish, and once more by close(), which runs at
+    interpreter exit if it wasn't called before. A path ending in .prom is rewritten in prometheus
+    text format, anything else gets one json line appended per export.
+    """
+
+    def __init__(self, path: Optional[str] = None, interval: float = 10.0, sample: int = 1):
+        self.path, self.interval, self.sample = path, interval, sample
+        self.metrics = {}
+        self.matches = self.counter('gt_matches_total', 'matches completed')
+        self.moves = self.counter('gt_moves_total', 'moves played')
+        self.match_seconds = self.histogram('gt_match_seconds', 'wall time per match, sampled')
+        self.round_seconds = self.histogram('gt_round_pairing_seconds', 'wall time to pair a tournament round')
+        self.queue_depth = self.gauge('gt_queue_depth', 'match chunks queued for worker processes')
+        self._due = time.perf_counter() + interval if path else float('inf')
+        if path:
+            atexit.register(self.close)
+
+    def counter(self, name, help='') -> Counter:
+        return self._get(Counter, name, help)
+
+    def gauge(self, name, help='') -> Gauge:
+        return self._get(Gauge, name, help)
+
+    def histogram(self, name, help='', bounds=SECONDS_BUCKETS) -> Histogram:
+        return self._get(Histogram, name, help, bounds)
+
+    def _get(self, kind, name, *args):
+        metric = self.metrics.get(name)
+        if metric is None:
+            metric = self.metrics[name] = kind(name, *args)
+        elif type(metric) is not kind:
+            raise ValueError(f'metric {name!r} is a {metric.kind}, not a {kind.kind}')
+        return metric
+
+    def finish_match(self, start: float, nmoves: int) -> None:
+        """record a match that started at perf_counter() time start"""
+        self.matches.value += 1
+        self.moves.value += nmoves
+        if self.matches.value % self.sample == 0:
+            now = time.perf_counter()
+            self.match_seconds.observe(now - start)
+            self.maybe_export(now)
+
+    def maybe_export(self, now: Optional[float] = None) -> None:
+        """export to path if interval seconds have passed since the last export"""
+        if (time.perf_counter() if now is None else now) >= self._due:
+            self.export()
+
+    def close(self) -> None:
+        """final export to path, so runs shorter than interval are exported too"""
+        if self.path:
+            atexit.unregister(self.close)
+            self.export()
+
+    def snapshot(self) -> dict:
+        return {name: metric.snapshot() for name, metric in self.metrics.items()}
+
+    def to_json(self) -> str:
+        return json.dumps(dict(time=time.time(), metrics=self.snapshot()))
+
+    def to_prometheus(self) -> str:
+        lines = []
+        for name, metric in self.metrics.items():
+            lines += [f'# HELP {name} {metric.help}', f'# TYPE {name} {metric.kind}']
+            if metric.kind != 'histogram':
+                lines.append(f'{name} {metric.value}')
+                continue
+            total = 0
+            for bound, n in zip(metric.bounds, metric.counts):
+                total += n
+                lines.append(f'{name}_bucket{{le="{bound:g}"}} {total}')
+            lines.append(f'{name}_bucket{{le="+Inf"}} {metric.count}')
+            lines += [f'{name}_sum {metric.sum}', f'{name}_count {metric.count}']
+        return '\n'.join(lines) + '\n'
+
+    def export(self, path: Optional[str] = None) -> None:
+        path = path or self.path
+        if path.endswith('.prom'):
+            tmp = f'{path}.tmp'
+            with open(tmp, 'w') as out:
+                out.write(self.to_prometheus())
+            os.replace(tmp, path)
+        else:
+            with open(path, 'a') as out:
+                out.write(self.to_json() + '\n')
+        if self.path:
+            self._due = time.perf_counter() + self.interval
+
+active: Optional[MetricsRegistry] = MetricsRegistry(os.environ['GT_METRICS']) if os.environ.get('GT_METRICS') else None
+
+def set_metrics(registry: Optional[MetricsRegistry]) -> Optional[MetricsRegistry]:
+    """make registry the one runners and tournaments record into, None turns recording off; returns the old one"""
+    global active
+    old, active = active, registry
+    return old
@@ -0,0 +1,29 @@
+import sys
+import time
+
+class Progress:
+    """streams matches/sec and moves/sec to stderr, at most every interval seconds"""
+
+    def __init__(self, total, interval=0.5, stream=sys.stderr):
+        self.total, self.interval, self.stream = total, interval, stream
+        self.matches = self.moves = 0
+        self.start = self.last = time.perf_counter()
+
+    def __call__(self, nmatch, nmove):
+        self.matches += nmatch
+        self.moves += nmove
+        now = time.perf_counter()
+        if now - self.last >= self.interval:
+            self.last = now
+            self.report(now, end='\r')
+
+    def report(self, now, end):
+        elapsed = max(now - self.start, 1e-9)
+        print(f'{self.matches}/{self.total} matches  {self.matches / elapsed:,.0f} matches/s  '
+              f'{self.moves / elapsed:,.0f} moves/s  {elapsed:.1f}s',
+              end=end,
+              file=self.stream,
+              flush=True)
+
+    def finish(self):
+        self.report(time.perf_counter(), end='\n')
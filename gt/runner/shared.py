@@ -0,0 +1,208 @@
+import copy
+import multiprocessing
+import random
+import time
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Callable, Optional, Sequence
+
+import numpy as np
+
+import gt
+from gt.runner import metrics
+from gt.runner.match_runner import MatchRunner
+
+MOVE_BITS = dict(C=0, D=1)
+BIT_MOVES = 'CD'
+
+@dataclass
+class SharedMatchResults:
+    """per-slot match results; moves[slot, player] is the bit-packed move string, 1 meaning defect"""
+    scores: np.ndarray
+    lengths: np.ndarray
+    moves: Optional[np.ndarray] = None
+
+    def __len__(self):
+        return len(self.scores)
+
+    def history(self, slot: int) -> gt.GameHistory:
+        if self.moves is None:
+            raise ValueError('match histories were not recorded, pass history=True')
+        bits = np.unpackbits(self.moves[slot], axis=-1, count=int(self.lengths[slot]))
+        history = gt.GameHistory()
+        for move1, move2 in bits.T:
+            history.add_moves(BIT_MOVES[move1], BIT_MOVES[move2])
+        return history
+
+@dataclass
+class MatchSchedule:
+    """nmatch matches cycling over all pairs of a roster, self-play included, each built when it is played
+
+    Only the roster of picklable strategy factories is sent to workers, so memory does not grow with
+    nmatch. Game lengths are drawn per slot from gamelen=(lo, hi) with gamelen_seed.
+    """
+    roster: list[Callable[[], gt.Strategy]]
+    nmatch: int
+    gamelen: tuple[int, int] = (100, 100)
+    gamelen_seed: Optional[int] = None
+    jit: bool = False
+
+    def __post_init__(self):
+        if self.gamelen_seed is None:
+            self.gamelen_seed = random.getrandbits(64)
+        self.pairs = [(i, j) for i in range(len(self.roster)) for j in range(i + 1)]
+
+    @property
+    def max_gamelen(self) -> int:
+        return self.gamelen[1]
+
+    def __len__(self):
+        return self.nmatch
+
+    def __getitem__(self, slot: int) -> MatchRunner:
+        if not 0 <= slot < self.nmatch:
+            raise IndexError(slot)
+        i, j = self.pairs[slot % len(self.pairs)]
+        lo, hi = self.gamelen
+        gamelen = lo if lo == hi else random.Random(f'{self.gamelen_seed}:{slot}').randint(lo, hi)
+        return MatchRunner(self.roster[i](), self.roster[j](), gamelen=gamelen, jit=self.jit)
+
+class _SharedBlock:
+    """one shared memory segment carved into named numpy arrays"""
+
+    def __init__(self, layout, name=None):
+        self.layout = layout
+        nbytes = sum(np.dtype(dtype).itemsize * int(np.prod(shape)) for shape, dtype in layout.values())
+        if name is None:
+            self.shm = shared_memory.SharedMemory(create=True, size=max(nbytes, 1))
+        else:
+            self.shm = _attach(name)
+        self.arrays, offset = {}, 0
+        for key, (shape, dtype) in layout.items():
+            self.arrays[key] = np.ndarray(shape, dtype=dtype, buffer=self.shm.buf, offset=offset)
+            offset += self.arrays[key].nbytes
+
+    def close(self):
+        self.arrays.clear()
+        self.shm.close()
+
+def _attach(name):
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:  # track was added in python 3.13
+        return shared_memory.SharedMemory(name=name)
+
+def play_matches_shared(
+    matches: Sequence[MatchRunner],
+    nworkers: Optional[int] = None,
+    history: bool = False,
+    seed: Optional[int] = None,
+    chunksize: int = 64,
+    progress: Optional[Callable[[int, int], None]] = None,
+    scorer: Optional[gt.GameScorer] = None,
+) -> SharedMatchResults:
+    """play MatchRunners across processes, workers write results straight into shared memory
+
+    matches is a list, whose MatchRunners are copied before each play, or a sequence like
+    MatchSchedule that builds a fresh MatchRunner for each index.
+
+    The matches are handed to each worker once at startup, after which tasks and replies are just
+    slot ranges, so no GameHistory is ever pickled back to the parent. nworkers=0 plays in-process.
+    With a seed, each slot reseeds random so results don't depend on the worker count; in-process,
+    the caller's random state is restored afterwards. Without a seed, in-process games draw from the
+    caller's random stream like MatchRunner.play does. With history=True, streamed MatchRunners
+    record their full game through a sink. progress, if given, is called with the number of matches
+    and moves played as each chunk of slots finishes. Scores use scorer, the standard payoff
+    GameScorer by default. Workers don't record metrics themselves, the parent counts their matches
+    and moves per chunk into the active registry and tracks the number of queued chunks.
+    """
+    if isinstance(matches, list):
+        maxlen = max((m.get_game_girth() for m in matches), default=0)
+    else:
+        maxlen = matches.max_gamelen
+    layout = dict(scores=((len(matches), 2), np.int64), lengths=((len(matches), ), np.int64))
+    if history:
+        layout['moves'] = ((len(matches), 2, (maxlen + 7) // 8), np.uint8)
+    block = _SharedBlock(layout)
+    try:
+        chunks = [(i, min(i + chunksize, len(matches))) for i in range(0, len(matches), chunksize)]
+        registry = metrics.active
+        if registry: registry.queue_depth.set(len(chunks))
+        if nworkers == 0:
+            # per-slot reseeding must not leak into the caller's random stream
+            state = random.getstate()
+            _worker_init(block.shm.name, layout, matches, seed, scorer, pool=False)
+            try:
+                for chunk in chunks:
+                    nmatch, nmove, _ = _play_slots(chunk)
+                    if registry: registry.queue_depth.inc(-1)
+                    if progress: progress(nmatch, nmove)
+            finally:
+                _worker_close()
+                if seed is not None: random.setstate(state)
+        else:
+            ctx = multiprocessing.get_context()
+            initargs = (block.shm.name, layout, matches, seed, scorer)
+            with ctx.Pool(nworkers, initializer=_worker_init, initargs=initargs) as pool:
+                for nmatch, nmove, seconds in pool.imap_unordered(_play_slots, chunks):
+                    if registry:
+                        registry.queue_depth.inc(-1)
+                        registry.matches.inc(nmatch)
+                        registry.moves.inc(nmove)
+                        registry.match_seconds.observe(seconds / nmatch, nmatch)
+                        registry.maybe_export()
+                    if progress: progress(nmatch, nmove)
+        arrays = {key: val.copy() for key, val in block.arrays.items()}
+    finally:
+        block.close()
+        block.shm.unlink()
+    return SharedMatchResults(**arrays)
+
+_worker = None
+
+def _worker_init(shm_name, layout, matches, seed, scorer=None, pool=True):
+    """pool workers get fresh entropy and leave metrics to the parent, in-process play uses the caller's state"""
+    global _worker
+    if pool:
+        metrics.set_metrics(None)
+        if seed is None:
+            random.seed()
+    _worker = (_SharedBlock(layout, shm_name), matches, seed, scorer or gt.GameScorer())
+
+def _worker_close():
+    global _worker
+    _worker[0].close()
+    _worker = None
+
+def _play_slots(slots):
+    block, matches, seed, scorer = _worker
+    start = time.perf_counter()
+    scores, lengths, moves = block.arrays['scores'], block.arrays['lengths'], block.arrays.get('moves')
+    for slot in range(*slots):
+        if seed is not None:
+            random.seed(f'{seed}:{slot}')
+        match = copy.deepcopy(matches[slot]) if isinstance(matches, list) else matches[slot]
+        recorded = _record_moves(match) if moves is not None and match.stream else None
+        result = match.play()
+        scores[slot] = scorer.score_game(result)
+        lengths[slot] = len(result)
+        if moves is not None:
+            if isinstance(result, gt.ArrayHistory):
+                bits = result.moves
+            else:
+                entries = result.history if recorded is None else recorded
+                bits = np.array([[MOVE_BITS[m] for m in entry] for entry in entries], dtype=np.uint8)
+                bits = bits.reshape(-1, 2).T
+            moves[slot, :, :(len(result) + 7) // 8] = np.packbits(bits.reshape(2, -1), axis=-1)
+    return slots[1] - slots[0], int(lengths[slots[0]:slots[1]].sum()), time.perf_counter() - start
+
+def _record_moves(match):
+    """a streamed match only keeps its recent moves, so collect the full game through its sink"""
+    recorded, sink = [], match.sink
+
+    def record(move1, move2):
+        recorded.append((move1, move2))
+        if sink: sink(move1, move2)
+
+    match.sink = record
+    return recorded
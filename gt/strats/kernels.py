@@ -0,0 +1,66 @@
+"""strategy kernels for the compiled backend in gt.runner.jit
+
+A kernel is a plain function kernel(me, opp, n, u, params, state) -> move, restricted to what numba
+can compile: me and opp are int8 arrays of both players' earlier moves (0 cooperate, 1 defect, only
+[:n] is filled), n is the number of moves already played, u is a uniform random number drawn for this
+move, params holds the strategy's float parameters and state is a float64 scratch array that lives
+for the whole game, for running aggregates.
+"""
+
+C, D = 0, 1
+
+def titfortat(me, opp, n, u, params, state):
+    if n == 0:
+        return C
+    return opp[n - 1]
+
+def alwaysdefect(me, opp, n, u, params, state):
+    return D
+
+def alwayscooperate(me, opp, n, u, params, state):
+    return C
+
+def random(me, opp, n, u, params, state):
+    return D if u < 0.5 else C
+
+def titfortwotats(me, opp, n, u, params, state):
+    if n < 3:
+        return C
+    if opp[n - 1] == D and opp[n - 2] == D:
+        return D
+    return C
+
+def sometimesdefect(me, opp, n, u, params, state):
+    if n == 0:
+        return C
+    return D if u < params[0] else C
+
+def grudger(me, opp, n, u, params, state):
+    if n > 0 and opp[n - 1] == D:
+        state[0] = 1
+    return D if state[0] else C
+
+def prober(me, opp, n, u, params, state):
+    if n < 5:
+        return C
+    if opp[n - 1] == D and opp[n - 2] == D:
+        return D
+    if opp[n - 1] == C and opp[n - 2] == C:
+        return C
+    return D if u < 0.5 else C
+
+def cooperator(me, opp, n, u, params, state):
+    if n < 4:
+        return C
+    for k in range(n - 4, n):
+        if opp[k] != C:
+            return D
+    return C
+
+def defector(me, opp, n, u, params, state):
+    if n < 4:
+        return D
+    for k in range(n - 4, n):
+        if opp[k] != D:
+            return C
+    return D
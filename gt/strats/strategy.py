@@ -1,13 +1,26 @@
 import abc
 import random
 from dataclasses import dataclass, field
+from typing import Callable, ClassVar, Optional
 
 import gt
+from gt.strats import kernels
 
 @dataclass
 class Strategy:
-    """general stuff for iterated prisoners dilima games"""
+    """general stuff for iterated prisoners dilima games
+
+    lookback is how many recent moves compute_move reads; None means it may read the whole game. With
+    a lookback, MatchRunner(stream=True) swaps history for a RecentHistory ring buffer of that size.
+    kernel is an optional compiled-backend equivalent of compute_move, see gt.strats.kernels.
+    """
     history: gt.GameHistory = field(default_factory=gt.GameHistory)
+    lookback: ClassVar[Optional[int]] = None
+    kernel: ClassVar[Optional[Callable]] = None
+
+    def kernel_params(self) -> tuple:
+        """float parameters handed to the kernel"""
+        return ()
 
     def move(self, *a, **kw):
         """returns a move"""
@@ -28,6 +41,8 @@ class Strategy:
 
 class TitForTat(Strategy):
     """starts with cooperate and then copies the opponents last move"""
+    lookback = 1
+    kernel = staticmethod(kernels.titfortat)
 
     def compute_move(self):
         if not self.history:
@@ -37,21 +52,29 @@ class TitForTat(Strategy):
         return 'D'
 
 class AlwaysDefect(Strategy):
+    lookback = 0
+    kernel = staticmethod(kernels.alwaysdefect)
 
     def compute_move(self):
         return 'D'
 
 class AlwaysCooperate(Strategy):
+    lookback = 0
+    kernel = staticmethod(kernels.alwayscooperate)
 
     def compute_move(self):
         return 'C'
 
 class Random(Strategy):
+    lookback = 0
+    kernel = staticmethod(kernels.random)
 
     def compute_move(self):
         return random.choice(['C', 'D'])
 
 class TitForTwoTats(Strategy):
+    lookback = 2
+    kernel = staticmethod(kernels.titfortwotats)
 
     def compute_move(self):
         if not self.history:
@@ -63,11 +86,16 @@ class TitForTwoTats(Strategy):
         return 'C'
 
 class SometimesDefect(Strategy):
+    lookback = 0
+    kernel = staticmethod(kernels.sometimesdefect)
 
     def __init__(self, defect_prob=0.3):
         super().__init__()
         self.defect_prob = defect_prob
 
+    def kernel_params(self):
+        return (self.defect_prob, )
+
     def compute_move(self):
         if not self.history:
             return 'C'
@@ -76,15 +104,19 @@ class SometimesDefect(Strategy):
         return 'C'
 
 class Grudger(Strategy):
+    lookback = 0
+    kernel = staticmethod(kernels.grudger)
 
     def compute_move(self):
         if not self.history:
             return 'C'
-        if any(x.move2 == 'D' for x in self.history):
+        if self.history.defections[1]:
             return 'D'
         return 'C'
 
 class Prober(Strategy):
+    lookback = 2
+    kernel = staticmethod(kernels.prober)
 
     def compute_move(self):
         if len(self.history) < 5: return 'C'
@@ -93,6 +125,8 @@ class Prober(Strategy):
         return random.choice(['C', 'D'])
 
 class Cooperator(Strategy):
+    lookback = 4
+    kernel = staticmethod(kernels.cooperator)
 
     def compute_move(self):
         if len(self.history) < 4: return 'C'
@@ -100,6 +134,8 @@ class Cooperator(Strategy):
         return 'D'
 
 class Defector(Strategy):
+    lookback = 4
+    kernel = staticmethod(kernels.defector)
 
     def compute_move(self):
         if len(self.history) < 4: return 'D'
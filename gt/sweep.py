@@ -0,0 +1,193 @@
+import csv
+import itertools
+import multiprocessing
+import os
+import random
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+import gt
+
+@dataclass(frozen=True)
+class StrategySpec:
+    """a strategy class name plus constructor keywords; hashable, so identical pairings dedupe"""
+    name: str
+    params: tuple = ()
+
+    @property
+    def label(self) -> str:
+        if not self.params:
+            return self.name
+        return f"{self.name}({', '.join(f'{k}={v!r}' for k, v in self.params)})"
+
+    def make(self) -> gt.Strategy:
+        return getattr(gt, self.name)(**dict(self.params))
+
+def expand_grid(strategies: dict) -> list[list[StrategySpec]]:
+    """{'SometimesDefect': {'defect_prob': [0.1, 0.2]}, 'TitForTat': {}} to the specs for each strategy"""
+    specs = []
+    for name, grid in strategies.items():
+        keys = sorted(grid or {})
+        grid_values = itertools.product(*(grid[k] for k in keys))
+        specs.append([StrategySpec(name, tuple(zip(keys, values))) for values in grid_values])
+    return specs
+
+def gamelen_label(gamelen) -> str:
+    return str(gamelen) if isinstance(gamelen, int) else f'{gamelen[0]}:{gamelen[1]}'
+
+@dataclass
+class SweepResult:
+    """tidy table, one row per (grid point, pairing); scores are means over repeats"""
+    columns: dict
+    nplayed: int = 0
+    ncached: int = 0
+
+    def __len__(self):
+        return len(next(iter(self.columns.values())))
+
+    def to_csv(self, path):
+        with open(path, 'w', newline='') as out:
+            writer = csv.writer(out)
+            writer.writerow(self.columns)
+            writer.writerows(zip(*(col.tolist() for col in self.columns.values())))
+
+    def to_npz(self, path):
+        with open(path, 'wb') as out:
+            np.savez(out, **self.columns)
+
+def sweep(
+    strategies: dict,
+    payoffs: Optional[dict] = None,
+    gamelens=(100, ),
+    nrepeat: int = 1,
+    seed: int = 0,
+    nworkers: Optional[int] = None,
+    cache: Optional[str] = None,
+    progress: bool = True,
+    chunksize: int = 16,
+) -> SweepResult:
+    """play an all-pairs tournament at every point of a strategy parameter x payoff x gamelen grid
+
+    strategies maps strategy class names to parameter grids (parameter name to list of values).
+    Pairings that are identical across grid points are played once, and payoff matrices never cost
+    extra games since each game is stored as its CC/CD/DC/DD counts. Games are seeded from their
+    pairing, so results in the npz cache file stay valid and an extended grid only plays new games.
+    """
+    payoffs = payoffs or dict(standard=gt.default_payoff())
+    gamelens = [g if isinstance(g, int) else tuple(g) for g in gamelens]
+    specs = expand_grid(strategies)
+    points = list(itertools.product(itertools.product(*specs), payoffs, gamelens))
+
+    units = {}
+    for roster, _, gamelen in points:
+        for i, j in _pairs(len(roster)):
+            for repeat in range(nrepeat):
+                units.setdefault((roster[i], roster[j], gamelen, repeat), len(units))
+    counts, nplayed = play_pairings(list(units), seed, nworkers, cache, progress, chunksize)
+
+    return SweepResult(_tabulate(points, payoffs, strategies, units, counts, nrepeat), nplayed, len(units) - nplayed)
+
+def play_pairings(keys, seed=0, nworkers=None, cache=None, progress=True, chunksize=16) -> tuple[np.ndarray, int]:
+    """outcome counts for (spec1, spec2, gamelen, repeat) keys, and how many had to be played
+
+    Keys found in the npz cache file under the same seed are not replayed, newly played ones are added to it.
+    """
+    cached = _load_cache(cache) if cache else {}
+    counts = np.zeros((len(keys), len(gt.OUTCOMES)), dtype=np.int64)
+    todo = []
+    for row, (spec1, spec2, gamelen, repeat) in enumerate(keys):
+        known = cached.get((str(seed), spec1.label, spec2.label, gamelen_label(gamelen), repeat))
+        if known is None: todo.append(row)
+        else: counts[row] = known
+    _play_units(keys, todo, counts, seed, nworkers, progress, chunksize)
+    if cache and todo:
+        _save_cache(cache, cached, keys, counts, seed)
+    return counts, len(todo)
+
+def _pairs(n):
+    return [(i, j) for i in range(n) for j in range(i + 1)]
+
+def _play_units(keys, todo, counts, seed, nworkers, progress, chunksize):
+    if not todo:
+        return
+    tasks = [(*keys[row], seed) for row in todo]
+    report = gt.Progress(len(tasks)) if progress else None
+    if nworkers == 0:
+        # per-game reseeding must not leak into the caller's random stream
+        state = random.getstate()
+        try:
+            _collect(map(_play_unit, tasks), todo, counts, report)
+        finally:
+            random.setstate(state)
+    else:
+        with multiprocessing.get_context().Pool(nworkers) as pool:
+            _collect(pool.imap(_play_unit, tasks, chunksize), todo, counts, report)
+    if report: report.finish()
+
+def _collect(results, todo, counts, report):
+    for row, result in zip(todo, results):
+        counts[row] = result
+        if report: report(1, sum(result))
+
+def _play_unit(task):
+    spec1, spec2, gamelen, repeat, seed = task
+    random.seed(f'{seed}|{spec1.label}|{spec2.label}|{gamelen_label(gamelen)}|{repeat}')
+    length = gamelen if isinstance(gamelen, int) else random.randint(*gamelen)
+    history = gt.MatchRunner(spec1.make(), spec2.make(), gamelen=length).play()
+    return gt.count_outcomes(history)
+
+def _tabulate(points, payoffs, strategies, units, counts, nrepeat):
+    rows = []
+    for ipoint, (roster, payoff_name, gamelen) in enumerate(points):
+        for i, j in _pairs(len(roster)):
+            rows.append((ipoint, roster, payoff_name, gamelen, roster[i], roster[j]))
+    columns = dict(
+        point=np.array([r[0] for r in rows], dtype=np.int64),
+        payoff=np.array([r[2] for r in rows]),
+        gamelen=np.array([gamelen_label(r[3]) for r in rows]),
+        strategy1=np.array([r[4].label for r in rows]),
+        strategy2=np.array([r[5].label for r in rows]),
+    )
+    for name, grid in strategies.items():
+        for param in sorted(grid or {}):
+            col = [dict(next(s for s in r[1] if s.name == name).params)[param] for r in rows]
+            columns[f'{name}.{param}'] = np.array(col)
+    score1, score2 = np.zeros(len(rows)), np.zeros(len(rows))
+    for name, payoff in payoffs.items():
+        matrix = np.array([payoff[k] for k in gt.OUTCOMES], dtype=np.float64)
+        scores = counts @ matrix
+        for k, (_, _, payoff_name, gamelen, spec1, spec2) in enumerate(rows):
+            if payoff_name != name: continue
+            unit_rows = [units[spec1, spec2, gamelen, repeat] for repeat in range(nrepeat)]
+            score1[k], score2[k] = scores[unit_rows].mean(axis=0)
+    columns.update(score1=score1, score2=score2)
+    return columns
+
+def _load_cache(path):
+    if not os.path.exists(path):
+        return {}
+    with np.load(path) as data:
+        if 'seed' not in data:
+            # written before seeds were recorded, so its games cannot be matched to a seed
+            return {}
+        keys = zip(data['seed'].tolist(), data['strategy1'].tolist(), data['strategy2'].tolist(), data['gamelen'].tolist(),
+                   data['repeat'].tolist())
+        return dict(zip(keys, data['counts']))
+
+def _save_cache(path, cached, keys, counts, seed):
+    merged = dict(cached)
+    for (spec1, spec2, gamelen, repeat), row in zip(keys, counts):
+        merged[str(seed), spec1.label, spec2.label, gamelen_label(gamelen), repeat] = row
+    seeds, labels1, labels2, gamelens, repeats = zip(*merged) if merged else ((), (), (), (), ())
+    tmp = f'{path}.tmp'
+    with open(tmp, 'wb') as out:
+        np.savez(out,
+                 seed=np.array(seeds),
+                 strategy1=np.array(labels1),
+                 strategy2=np.array(labels2),
+                 gamelen=np.array(gamelens),
+                 repeat=np.array(repeats, dtype=np.int64),
+                 counts=np.array(list(merged.values()), dtype=np.int64).reshape(-1, len(gt.OUTCOMES)))
+    os.replace(tmp, path)
@@ -0,0 +1,35 @@
+import numpy as np
+
+import gt
+from gt import adaptive
+
+def main():
+    test_welford_matches_numpy()
+    test_adaptive_stops_settled_pairings()
+    print('pass!')
+
+def test_welford_matches_numpy():
+    rng = np.random.default_rng(0)
+    values, stream = rng.random((200, 2)), rng.integers(0, 4, 200)
+    stats = adaptive.Welford(5)
+    for chunk in np.array_split(np.arange(200), 7):
+        stats.update(stream[chunk], values[chunk])
+    for k in range(4):
+        assert stats.n[k] == np.sum(stream == k)
+        assert np.allclose(stats.mean[k], values[stream == k].mean(axis=0))
+        assert np.allclose(stats.var[k], values[stream == k].var(axis=0, ddof=1))
+    assert stats.n[4] == 0 and np.all(np.isinf(stats.var[4]))
+
+def test_adaptive_stops_settled_pairings():
+    strategies = [gt.TitForTat, gt.AlwaysDefect, gt.Random, lambda: gt.SometimesDefect(0.2)]
+    result = adaptive.adaptive_payoffs(strategies, gamelen=30, target_width=0.2, min_games=3, seed=4)
+    assert result.converged.all()
+    deterministic = result.pairs.index((1, 0))
+    assert result.ngames[deterministic] == 3
+    assert np.allclose(result.mean[deterministic], [(5 + 29) / 30, (0 + 29) / 30])
+    fixed = adaptive.fixed_payoffs(strategies, gamelen=30, ngames=result.ngames.max(), seed=4)
+    assert result.total_games * 2 < fixed.total_games
+    assert np.abs(result.payoff_matrix() - fixed.payoff_matrix()).max() < 0.2
+
+if __name__ == '__main__':
+    main()
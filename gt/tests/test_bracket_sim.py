@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+import gt
+from gt import bracket_sim
+from gt.ai_tourney import TourneyType
+
+def main():
+    test_single_elimination_favorite_always_wins()
+    test_single_elimination_byes()
+    test_single_elimination_is_seeded()
+    test_round_robin_places()
+    test_swiss_places()
+    test_winprob_from_payoffs()
+    test_unsupported_type()
+    print('pass!')
+
+def _skill_winprob(nplayer, scale=1.0):
+    skill = np.arange(nplayer)[::-1].astype(float)
+    return 1 / (1 + np.exp(-(skill[:, None] - skill[None]) / scale))
+
+def test_single_elimination_favorite_always_wins():
+    winprob = bracket_sim.winprob_from_payoffs(np.arange(8)[::-1, None] * np.ones(8))
+    result = bracket_sim.simulate_tournaments(winprob, TourneyType.SINGLE_ELIMINATION, 100, seed=0, shuffle=True)
+    assert result.counts.shape == (8, 4)
+    assert np.all(result.win_prob == [1, 0, 0, 0, 0, 0, 0, 0])
+    assert np.all(result.counts.sum(axis=0) == [100, 100, 200, 400])
+
+def test_single_elimination_byes():
+    result = bracket_sim.simulate_tournaments(_skill_winprob(5), TourneyType.SINGLE_ELIMINATION, 2000, seed=1)
+    assert np.allclose(result.probs.sum(axis=1), 1)
+    # the top three seeds get byes and can never go out in the first round
+    assert np.all(result.counts[:3, -1] == 0)
+    assert result.win_prob[0] > result.win_prob[4]
+
+def test_single_elimination_is_seeded():
+    assert list(bracket_sim._bracket_seeds(8)) == [0, 7, 3, 4, 1, 6, 2, 5]
+    winprob = bracket_sim.winprob_from_payoffs(np.arange(8)[::-1, None] * np.ones(8))
+    result = bracket_sim.simulate_tournaments(winprob, TourneyType.SINGLE_ELIMINATION, 10, seed=0)
+    # players 0 and 1 meet in the final, players 2 and 3 go out to them in the semifinals
+    assert list(result.probs.argmax(axis=1)) == [0, 1, 2, 2, 3, 3, 3, 3]
+
+def test_round_robin_places():
+    result = bracket_sim.simulate_tournaments(_skill_winprob(6, 2), TourneyType.ROUND_ROBIN, 2000, seed=2, chunk=300)
+    assert result.counts.shape == (6, 6)
+    assert np.all(result.counts.sum(axis=0) == 2000)
+    assert np.all(np.diff(result.expected_place) > 0)
+
+def test_swiss_places():
+    result = bracket_sim.simulate_tournaments(_skill_winprob(7), TourneyType.SWISS, 1000, seed=3)
+    assert np.all(result.counts.sum(axis=0) == 1000)
+    assert result.expected_place[0] < result.expected_place[-1]
+
+def test_winprob_from_payoffs():
+    scorer = gt.GameScorer()
+    strats = [gt.AlwaysDefect, gt.AlwaysCooperate]
+    payoffs = np.zeros((2, 2))
+    for i, s1 in enumerate(strats):
+        for j, s2 in enumerate(strats):
+            payoffs[i, j] = scorer.score_game(gt.MatchRunner(s1(), s2(), gamelen=10).play())[0]
+    assert np.all(bracket_sim.winprob_from_payoffs(payoffs) == [[0.5, 1], [0, 0.5]])
+    soft = bracket_sim.winprob_from_payoffs(payoffs, temperature=10)
+    assert np.allclose(soft + soft.T, 1)
+
+def test_unsupported_type():
+    with pytest.raises(ValueError):
+        bracket_sim.simulate_tournaments(np.full((4, 4), 0.5), TourneyType.DOUBLE_ELIMINATION, 10)
+
+if __name__ == '__main__':
+    main()
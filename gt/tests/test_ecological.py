@@ -0,0 +1,60 @@
+import random
+
+import numpy as np
+
+from gt.ecological import EcologicalTournament
+from gt.sweep import StrategySpec
+
+def main():
+    import tempfile
+    with tempfile.TemporaryDirectory() as tmp:
+        test_add_plays_only_new_pairings(tmp)
+    test_generations_reweight_by_score()
+    test_empty_roster()
+    test_keeps_caller_random_state()
+    print('pass!')
+
+ROSTER = ['TitForTat', 'AlwaysDefect', 'Random', StrategySpec('SometimesDefect', (('defect_prob', 0.2), ))]
+
+def test_add_plays_only_new_pairings(tmp_path):
+    cache = f'{tmp_path}/eco.npz'
+    eco = EcologicalTournament(ROSTER[:3], gamelen=30, nrepeat=2, cache=cache)
+    assert eco.nplayed == 2 * 6
+    eco.add(ROSTER[3])
+    assert eco.nplayed == 2 * 10
+    full = EcologicalTournament(ROSTER, gamelen=30, nrepeat=2)
+    assert np.allclose(eco.payoffs, full.payoffs)
+    assert np.allclose(eco.counts.sum(axis=2), 30)
+    cached = EcologicalTournament(ROSTER, gamelen=30, nrepeat=2, cache=cache)
+    assert cached.nplayed == 0 and np.allclose(cached.payoffs, full.payoffs)
+    reseeded = EcologicalTournament(ROSTER, gamelen=30, nrepeat=2, seed=1, cache=cache)
+    assert reseeded.nplayed == 2 * 10
+
+def test_generations_reweight_by_score():
+    eco = EcologicalTournament(['TitForTat', 'AlwaysDefect', 'AlwaysCooperate'], gamelen=10)
+    assert np.allclose(eco.payoffs, [[30, 9, 30], [14, 10, 50], [30, 0, 30]])
+    result = eco.run(200, weights=[1, 1, 2])
+    assert np.allclose(result.populations.sum(axis=1), 1)
+    start = np.array([0.25, 0.25, 0.5])
+    step = start * (eco.payoffs @ start)
+    assert np.allclose(result.populations[1], step / step.sum())
+    assert result.survivors() == ['TitForTat', 'AlwaysCooperate']
+    assert result.final['AlwaysDefect'] < 1e-3
+
+def test_empty_roster():
+    eco = EcologicalTournament([], gamelen=10)
+    eco.add()
+    assert eco.counts.shape == (0, 0, 4) and eco.nplayed == 0
+    eco.add('TitForTat')
+    assert eco.labels == ['TitForTat'] and np.allclose(eco.payoffs, [[30]])
+
+def test_keeps_caller_random_state():
+    random.seed(5)
+    expected = random.random()
+    random.seed(5)
+    eco = EcologicalTournament(['TitForTat', 'Random'], gamelen=10)
+    eco.add('Prober')
+    assert random.random() == expected
+
+if __name__ == '__main__':
+    main()
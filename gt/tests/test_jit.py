@@ -0,0 +1,86 @@
+import os
+import random
+
+import numpy as np
+import pytest
+
+import gt
+from gt.runner import jit
+
+STRATEGIES = [
+    gt.TitForTat, gt.AlwaysDefect, gt.AlwaysCooperate, gt.Random, gt.TitForTwoTats, gt.SometimesDefect, gt.Grudger,
+    gt.Prober, gt.Cooperator, gt.Defector
+]
+DETERMINISTIC = [
+    gt.TitForTat, gt.AlwaysDefect, gt.AlwaysCooperate, gt.TitForTwoTats, gt.Grudger, gt.Cooperator, gt.Defector
+]
+
+def main():
+    test_kernels_match_compute_move()
+    test_stochastic_kernels_match_rates()
+    test_compiled_matches_python_kernels()
+    test_jit_runner_scores()
+    test_fallback_without_kernel()
+    test_stream_takes_precedence()
+    print('pass!')
+
+def _interpreted(strat1, strat2, gamelen):
+    history = gt.MatchRunner(strat1, strat2, gamelen=gamelen).play()
+    return np.array([[gt.MOVE_BITS[m] for m in entry] for entry in history], dtype=np.int8).T.reshape(2, -1)
+
+def test_kernels_match_compute_move():
+    for strat1 in DETERMINISTIC:
+        for strat2 in DETERMINISTIC:
+            expected = _interpreted(strat1(), strat2(), 40)
+            assert (jit.play_kernels(strat1(), strat2(), 40, compiled=False) == expected).all(), (strat1, strat2)
+
+def test_stochastic_kernels_match_rates():
+    random.seed(0)
+    for strat in [gt.Random, lambda: gt.SometimesDefect(0.1), gt.Prober]:
+        for opponent in [gt.AlwaysCooperate, gt.TitForTat, gt.AlwaysDefect]:
+            expected = _interpreted(strat(), opponent(), 4000).mean(axis=1)
+            kernel = jit.play_kernels(strat(), opponent(), 4000, compiled=False).mean(axis=1)
+            assert np.allclose(kernel, expected, atol=0.05)
+
+def test_compiled_matches_python_kernels():
+    pytest.importorskip('numba')
+    for strat1 in STRATEGIES:
+        for strat2 in STRATEGIES:
+            random.seed(1)
+            compiled = jit.play_kernels(strat1(), strat2(), 50)
+            random.seed(1)
+            assert (compiled == jit.play_kernels(strat1(), strat2(), 50, compiled=False)).all(), (strat1, strat2)
+
+def test_jit_runner_scores():
+    pytest.importorskip('numba')
+    matches = [gt.MatchRunner(gt.Grudger(), gt.Prober(), gamelen=30, jit=True) for _ in range(4)]
+    results = gt.play_matches_shared(matches, nworkers=0, history=True, seed=3)
+    history = results.history(0)
+    assert isinstance(matches[0].play(), gt.ArrayHistory)
+    assert tuple(results.scores[0]) == gt.GameScorer().score_game(history)
+    assert ''.join(e.move2 for e in history)[:5] == 'CCCCC'
+
+def test_fallback_without_kernel():
+
+    class Stubborn(gt.TitForTat):
+
+        def compute_move(self):
+            return 'D'
+
+    assert jit.kernel_of(Stubborn()) is None
+    history = gt.MatchRunner(Stubborn(), gt.TitForTat(), gamelen=5, jit=True).play()
+    assert isinstance(history, gt.GameHistory) and history.defections == [5, 4]
+    os.environ['GT_DISABLE_JIT'] = '1'
+    try:
+        assert not jit.accelerated()
+        history = gt.MatchRunner(gt.TitForTat(), gt.AlwaysDefect(), gamelen=5, jit=True).play()
+    finally:
+        del os.environ['GT_DISABLE_JIT']
+    assert isinstance(history, gt.GameHistory) and history.defections == [4, 5]
+
+def test_stream_takes_precedence():
+    history = gt.MatchRunner(gt.TitForTat(), gt.AlwaysDefect(), gamelen=50, stream=True, jit=True).play()
+    assert isinstance(history, gt.RecentHistory) and history.defections == [49, 50]
+
+if __name__ == '__main__':
+    main()
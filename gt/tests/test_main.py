@@ -0,0 +1,52 @@
+import csv
+
+import numpy as np
+import pytest
+
+from gt import __main__ as cli
+
+def main():
+    import tempfile
+    with tempfile.TemporaryDirectory() as tmp:
+        test_cli_backends_agree(tmp)
+    test_parse_strategy()
+    test_multiprocess_needs_workers()
+    test_schedule_builds_matches_lazily()
+    print('pass!')
+
+def test_cli_backends_agree(tmp_path):
+    argv = ['TitForTat', 'Random', 'SometimesDefect:0.2', '-n', '30', '-g', '5:20', '-s', '11', '-q']
+    serial = cli.main([*argv, '-b', 'serial', '-o', f'{tmp_path}/serial.csv'])
+    batched = cli.main([*argv, '-b', 'batched', '--chunksize', '7'])
+    multi = cli.main([*argv, '-b', 'multiprocess', '-w', '2'])
+    assert np.all(serial.scores == batched.scores) and np.all(serial.scores == multi.scores)
+    assert np.all((5 <= serial.lengths) & (serial.lengths <= 20))
+    with open(f'{tmp_path}/serial.csv') as inp:
+        rows = list(csv.DictReader(inp))
+    assert len(rows) == 30
+    assert rows[1]['player1'] == 'Random' and rows[1]['player2'] == 'TitForTat'
+
+def test_parse_strategy():
+    name, factory = cli.parse_strategy('SometimesDefect:0.25')
+    assert factory().defect_prob == 0.25
+    assert cli.parse_gamelen('7') == (7, 7)
+    for spec in ('Strategy', 'NotAStrategy'):
+        with pytest.raises(SystemExit):
+            cli.parse_strategy(spec)
+
+def test_multiprocess_needs_workers():
+    with pytest.raises(SystemExit):
+        cli.parse_args(['-b', 'multiprocess', '-w', '0'])
+    assert cli.parse_args(['-b', 'batched', '-w', '0']).workers == 0
+
+def test_schedule_builds_matches_lazily():
+    roster = [cli.parse_strategy(spec) for spec in ['TitForTat', 'SometimesDefect:0.2']]
+    schedule, pairs = cli.build_matches(roster, 10**8, (5, 20), seed=3)
+    assert len(schedule) == 10**8 and pairs == [(0, 0), (1, 0), (1, 1)]
+    match = schedule[10**8 - 3]
+    assert isinstance(match.player1, cli.gt.SometimesDefect) and isinstance(match.player2, cli.gt.TitForTat)
+    assert match.gamelen == schedule[10**8 - 3].gamelen and 5 <= match.gamelen <= 20
+    assert match is not schedule[10**8 - 3]
+
+if __name__ == '__main__':
+    main()
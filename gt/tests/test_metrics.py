@@ -0,0 +1,115 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import pytest
+
+import gt
+from gt.ai_tourney import Tourney, TourneyConfig, TourneyPlayer, TourneyType
+
+def main():
+    test_runner_records_matches()
+    test_shared_records_worker_chunks()
+    test_round_pairing_time()
+    test_export_formats()
+    test_shared_exports_while_running()
+    test_short_runs_are_exported()
+    test_overhead_is_small()
+    print('pass!')
+
+def _recording(**kw):
+    registry = gt.MetricsRegistry(**kw)
+    return registry, gt.set_metrics(registry)
+
+def test_runner_records_matches():
+    registry, old = _recording(sample=2)
+    try:
+        players = [gt.Player(gt.TitForTat(), 'a'), gt.Player(gt.Prober(), 'b')]
+        gt.Tourney(players, gt.AllPairs(gamelen=20)).run()
+    finally:
+        gt.set_metrics(old)
+    assert registry.matches.value == 3 and registry.moves.value == 60
+    assert registry.match_seconds.count == 1 and sum(registry.match_seconds.counts) == 1
+
+def test_shared_records_worker_chunks():
+    registry, old = _recording()
+    try:
+        matches = [gt.MatchRunner(gt.Random(), gt.Grudger(), gamelen=10) for _ in range(20)]
+        gt.play_matches_shared(matches, nworkers=2, chunksize=3)
+    finally:
+        gt.set_metrics(old)
+    assert registry.matches.value == 20 and registry.moves.value == 200
+    assert registry.match_seconds.count == 20
+    assert registry.queue_depth.value == 0
+
+def test_round_pairing_time():
+    registry, old = _recording()
+    try:
+        players = [TourneyPlayer(id=f'p{i}', name=f'p{i}') for i in range(6)]
+        tourney = Tourney(TourneyConfig(TourneyType.ROUND_ROBIN, 'rr'), players)
+        while not tourney.completed:
+            tourney.record_results((m.id, m.player1.id, False) for m in tourney.get_upcoming_matches())
+    finally:
+        gt.set_metrics(old)
+    assert registry.round_seconds.count == 5
+    assert registry.matches.value == 15
+
+def test_export_formats():
+    with tempfile.TemporaryDirectory() as tmp:
+        registry = gt.MetricsRegistry(os.path.join(tmp, 'metrics.jsonl'), interval=0)
+        registry.finish_match(time.perf_counter(), 7)
+        registry.finish_match(time.perf_counter(), 5)
+        with open(registry.path) as inp:
+            lines = [json.loads(line) for line in inp]
+        assert [line['metrics']['gt_moves_total'] for line in lines] == [7, 12]
+        registry.close()
+        registry.export(os.path.join(tmp, 'metrics.prom'))
+        with open(os.path.join(tmp, 'metrics.prom')) as inp:
+            text = inp.read()
+    assert 'gt_matches_total 2\n' in text and 'gt_match_seconds_bucket{le="+Inf"} 2\n' in text
+    assert '# TYPE gt_queue_depth gauge' in text
+
+def test_shared_exports_while_running():
+    with tempfile.TemporaryDirectory() as tmp:
+        registry, old = _recording(path=os.path.join(tmp, 'metrics.jsonl'), interval=0)
+        try:
+            matches = [gt.MatchRunner(gt.Random(), gt.Grudger(), gamelen=10) for _ in range(40)]
+            gt.play_matches_shared(matches, nworkers=2, chunksize=10)
+            with open(registry.path) as inp:
+                lines = [json.loads(line) for line in inp]
+        finally:
+            gt.set_metrics(old)
+            registry.close()
+    assert len(lines) == 4 and lines[-1]['metrics']['gt_matches_total'] == 40
+
+def test_short_runs_are_exported():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'metrics.prom')
+        code = 'import gt; gt.MatchRunner(gt.TitForTat(), gt.Random(), gamelen=9).play()'
+        subprocess.run([sys.executable, '-c', code], env=dict(os.environ, GT_METRICS=path), check=True)
+        with open(path) as inp:
+            text = inp.read()
+    assert 'gt_matches_total 1\n' in text and 'gt_moves_total 9\n' in text
+
+def bench_metrics_overhead(gamelen=100, nmatch=200):
+    """cost of recording one match relative to playing a gamelen TitForTat vs Random match"""
+    registry = gt.MetricsRegistry()
+    start = time.perf_counter()
+    for _ in range(nmatch):
+        registry.finish_match(time.perf_counter(), gamelen)
+    record = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(nmatch):
+        gt.MatchRunner(gt.TitForTat(), gt.Random(), gamelen=gamelen)._play()
+    return record / (time.perf_counter() - start)
+
+@pytest.mark.ci
+def test_overhead_is_small():
+    assert min(bench_metrics_overhead() for _ in range(3)) < 0.01
+
+if __name__ == '__main__':
+    print(f'metrics overhead {bench_metrics_overhead():.2%}')
+    main()
@@ -0,0 +1,108 @@
+import time
+
+import numpy as np
+import pytest
+
+from gt.ai_tourney import Tourney, TourneyConfig, TourneyPlayer, TourneyType
+
+def main():
+    test_record_results_matches_single_results()
+    test_record_results_validates_whole_batch()
+    test_record_results_advances_rounds()
+    test_record_result_rows()
+    test_record_result_rows_is_fast()
+    print(f'{bench_record_results():.3f}s to ingest 1M results by id')
+    print(f'{bench_record_results(rows=True):.3f}s to ingest 1M results by row')
+    print('pass!')
+
+def _tourney(nplayer, tourney_type=TourneyType.SWISS):
+    players = [TourneyPlayer(f'p{i}', f'p{i}') for i in range(nplayer)]
+    return Tourney(TourneyConfig(tourney_type, 'batch', random_seed=0), players)
+
+def _results(tourney):
+    rng = np.random.default_rng(0)
+    results = []
+    for match, r in zip(tourney.get_upcoming_matches(), rng.random(len(tourney.matches))):
+        if r < 0.2: results.append((match.id, None, True))
+        else: results.append((match.id, match.player1.id if r < 0.6 else match.player2.id, False))
+    return results
+
+def test_record_results_matches_single_results():
+    single, batch = _tourney(40), _tourney(40)
+    for result in _results(single):
+        single.record_match_result(*result)
+    batch.record_results(_results(batch))
+    assert [repr(p) for p in single.rankings] == [repr(p) for p in batch.rankings]
+    assert len(single.matches) == len(batch.matches)
+    p = batch.rankings[0]
+    assert p.score == 3 * p.matches_won + p.matches_drawn
+    assert p.matches_played == 1
+
+def test_record_results_validates_whole_batch():
+    tourney = _tourney(8)
+    m0, m1 = tourney.matches[:2]
+    with pytest.raises(ValueError, match='not found'):
+        tourney.record_results([(m0.id, m0.player1.id, False), ('nope', None, True)])
+    with pytest.raises(ValueError, match='more than once'):
+        tourney.record_results([(m0.id, m0.player1.id, False), (m0.id, None, True)])
+    with pytest.raises(ValueError, match='does not match'):
+        tourney.record_results([(m0.id, m0.player1.id, False), (m1.id, m0.player1.id, False)])
+    assert not m0.completed and m0.player1.matches_played == 0
+    tourney.record_results([(m0.id, m0.player1.id, False)])
+    with pytest.raises(ValueError, match='already been completed'):
+        tourney.record_results([(m0.id, m0.player1.id, False)])
+
+def test_record_results_advances_rounds():
+    tourney = _tourney(16, TourneyType.SINGLE_ELIMINATION)
+    while not tourney.completed:
+        tourney.record_results((m.id, m.player1.id, False) for m in tourney.get_upcoming_matches())
+    assert tourney.rankings[0].matches_won == 4
+    tourney = _tourney(6, TourneyType.ROUND_ROBIN)
+    while not tourney.completed:
+        tourney.record_results((m.id, m.player1.id, False) for m in tourney.get_upcoming_matches())
+    assert len(tourney.matches) == 15 and tourney.current_round == 5
+
+def test_record_result_rows():
+    by_id, by_row = _tourney(40), _tourney(40)
+    results = _results(by_id)
+    by_id.record_results(results)
+    rows = {m.id: i for i, m in enumerate(by_row.matches)}
+    by_row.record_result_rows([rows[m] for m, _, _ in results],
+                              [-1 if draw else by_row.matches[rows[m]].player2.id == w for m, w, draw in results],
+                              [draw for _, _, draw in results])
+    assert [repr(p) for p in by_id.rankings] == [repr(p) for p in by_row.rankings]
+    tourney = _tourney(8)
+    with pytest.raises(ValueError, match='not found'):
+        tourney.record_result_rows([0, 4], [0, 0], [False, False])
+    with pytest.raises(ValueError, match='more than once'):
+        tourney.record_result_rows([1, 1], [0, 0], [False, True])
+    with pytest.raises(ValueError, match='must be 0 or 1'):
+        tourney.record_result_rows([0, 1], [0, 2], [False, False])
+    assert tourney.matches[0].player1.matches_played == 0
+    tourney.record_result_rows([0, 1], [0, -1], [False, True])
+    assert tourney.matches[1].is_draw and tourney.matches[0].winner is tourney.matches[0].player1
+    with pytest.raises(ValueError, match='already been completed'):
+        tourney.record_result_rows([0], [1], [False])
+
+@pytest.mark.ci
+def test_record_result_rows_is_fast():
+    assert bench_record_results(rows=True) < 1
+
+def bench_record_results(nmatch=2**20, rows=False):
+    """time to ingest one round of nmatch results by id, or by match row with rows=True;
+    one result is held back so no new round is paired"""
+    players = TourneyPlayer.create_many([f'p{i}' for i in range(2 * nmatch)], [''] * (2 * nmatch))
+    tourney = Tourney(TourneyConfig(TourneyType.SINGLE_ELIMINATION, 'bench', random_seed=0), players)
+    if rows:
+        index = np.arange(1, nmatch)
+        results = index, np.ones(len(index), dtype=np.int64), np.zeros(len(index), dtype=bool)
+        start = time.perf_counter()
+        tourney.record_result_rows(*results)
+    else:
+        results = [(m.id, m.player2.id, False) for m in tourney.matches[1:]]
+        start = time.perf_counter()
+        tourney.record_results(results)
+    return time.perf_counter() - start
+
+if __name__ == '__main__':
+    main()
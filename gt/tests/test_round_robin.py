@@ -0,0 +1,44 @@
+import pytest
+
+from gt.ai_tourney import RoundRobinSchedule, Tourney, TourneyConfig, TourneyPlayer, TourneyType
+
+def main():
+    test_schedule_covers_all_pairs()
+    test_schedule_random_access()
+    test_round_robin_creates_rounds_lazily()
+    print('pass!')
+
+def test_schedule_covers_all_pairs():
+    for nplayer in range(1, 12):
+        schedule = RoundRobinSchedule(nplayer)
+        assert len(schedule) == nplayer * (nplayer - 1) // 2
+        assert {frozenset(p) for p in schedule} == {frozenset((i, j)) for i in range(nplayer) for j in range(i)}
+        for r in range(schedule.nrounds):
+            seen = [p for pair in schedule.round(r) for p in pair]
+            assert len(seen) == len(set(seen))
+
+def test_schedule_random_access():
+    schedule = RoundRobinSchedule(10_001)
+    assert len(schedule) == 10_001 * 5_000
+    assert schedule[-1] == schedule.pairing(schedule.nrounds - 1, schedule.matches_per_round - 1)
+    assert schedule[123_456_7] == list(schedule.round(246))[4567]
+    with pytest.raises(IndexError):
+        schedule[len(schedule)]
+
+def test_round_robin_creates_rounds_lazily():
+    players = [TourneyPlayer(id=f'p{i}', name=f'p{i}') for i in range(7)]
+    tourney = Tourney(TourneyConfig(TourneyType.ROUND_ROBIN, 'rr'), players)
+    assert len(tourney.matches) == 3
+    assert tourney.current_round == 1 and len(tourney.get_current_round_matches()) == 3
+    nround = 0
+    while not tourney.completed:
+        for match in tourney.get_upcoming_matches():
+            tourney.record_match_result(match.id, match.player1.id)
+        nround += 1
+    assert nround == 7
+    assert len(tourney.matches) == 21
+    for player in players:
+        assert sum(player in (m.player1, m.player2) for m in tourney.matches) == 6
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+import random
+
+import numpy as np
+
+import gt
+
+def main():
+    test_shared_matches_serial_matches_parallel()
+    test_shared_history_roundtrip()
+    test_tourney_run_parallel()
+    test_in_process_keeps_caller_random_state()
+    print('pass!')
+
+def _matches():
+    strats = [gt.TitForTat, gt.Random, gt.Prober, gt.Grudger, gt.SometimesDefect]
+    return [gt.MatchRunner(s1(), s2(), gamelen=37) for s1 in strats for s2 in strats]
+
+def test_shared_matches_serial_matches_parallel():
+    serial = gt.play_matches_shared(_matches(), nworkers=0, seed=7, chunksize=4)
+    parallel = gt.play_matches_shared(_matches(), nworkers=2, seed=7, chunksize=4)
+    assert np.all(serial.scores == parallel.scores)
+    assert np.all(serial.lengths == 37)
+
+def test_shared_history_roundtrip():
+    matches = _matches()
+    results = gt.play_matches_shared(matches, nworkers=2, history=True, seed=3)
+    scorer = gt.GameScorer()
+    for slot in range(len(results)):
+        history = results.history(slot)
+        assert len(history) == 37
+        assert scorer.score_game(history) == tuple(results.scores[slot])
+    assert str(results.history(0)) == str(gt.MatchRunner(gt.TitForTat(), gt.TitForTat(), gamelen=37).play())
+
+def test_tourney_run_parallel():
+    players = [gt.Player(gt.Cooperator()), gt.Player(gt.Defector()), gt.Player(gt.TitForTat())]
+    tourney = gt.Tourney(players, gt.AllPairs(gamelen=20, num_matches=2))
+    results = tourney.run_parallel(nworkers=0)
+    assert len(results) == 12
+    assert results.moves is None
+
+def test_in_process_keeps_caller_random_state():
+    random.seed(1)
+    first = gt.play_matches_shared(_matches(), nworkers=0).scores
+    random.seed(1)
+    assert np.array_equal(gt.play_matches_shared(_matches(), nworkers=0).scores, first)
+    random.seed(2)
+    expected = random.random()
+    random.seed(2)
+    gt.play_matches_shared(_matches(), nworkers=0, seed=5)
+    assert random.random() == expected
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+import subprocess
+import sys
+
+import pytest
+
+import gt
+
+def main():
+    test_lazy_exports()
+    test_sequential_player_names()
+    test_import_gt_is_lean()
+    test_import_gt_is_fast()
+    print('pass!')
+
+def test_lazy_exports():
+    for name in gt.__all__:
+        assert getattr(gt, name) is not None
+    assert gt.bracket_sim.simulate_tournaments
+    assert 'MatchRunner' in dir(gt)
+    namespace = {}
+    exec('from gt import *', namespace)
+    assert namespace['TitForTat'] is gt.TitForTat
+
+def test_sequential_player_names():
+    gt.set_player_name_factory(gt.sequential_player_name)
+    try:
+        first, second = gt.Player(gt.Cooperator()), gt.Player(gt.Cooperator())
+        assert first.name.startswith('player') and first.name != second.name
+    finally:
+        gt.set_player_name_factory(gt.random_player_name)
+
+def bench_import_gt(nrepeat=5):
+    """best-of-n wall time for `import gt` in a fresh interpreter, plus the heavy modules it pulled in"""
+    code = ('import sys, time; t = time.perf_counter(); import gt; t = time.perf_counter() - t; '
+            'print(t, *[m for m in ("numpy", "names", "multiprocessing") if m in sys.modules])')
+    runs = [subprocess.check_output([sys.executable, '-c', code], text=True).split() for _ in range(nrepeat)]
+    return min(float(r[0]) for r in runs), runs[0][1:]
+
+def test_import_gt_is_lean():
+    _, heavy = bench_import_gt(nrepeat=1)
+    assert not heavy
+
+@pytest.mark.ci
+def test_import_gt_is_fast():
+    seconds, _ = bench_import_gt()
+    assert seconds < 0.02
+
+if __name__ == '__main__':
+    print(bench_import_gt())
+    main()
@@ -0,0 +1,79 @@
+import random
+import tracemalloc
+
+import pytest
+
+import gt
+
+STRATEGIES = [
+    gt.TitForTat, gt.AlwaysDefect, gt.AlwaysCooperate, gt.Random, gt.TitForTwoTats, gt.SometimesDefect, gt.Grudger,
+    gt.Prober, gt.Cooperator, gt.Defector
+]
+
+def main():
+    import tempfile
+    test_stream_matches_full_history()
+    test_recent_history_window()
+    with tempfile.TemporaryDirectory() as tmp:
+        test_stream_sink_roundtrip(tmp)
+    test_stream_memory_is_bounded()
+    test_stream_shared_history()
+    print('pass!')
+
+def test_stream_matches_full_history():
+    scorer = gt.GameScorer()
+    for strat1 in STRATEGIES:
+        for strat2 in STRATEGIES:
+            random.seed(0)
+            full = gt.MatchRunner(strat1(), strat2(), gamelen=60).play()
+            random.seed(0)
+            runner = gt.MatchRunner(strat1(), strat2(), gamelen=60, stream=True)
+            recent = runner.play()
+            assert isinstance(recent, gt.RecentHistory) and len(recent) == 60
+            assert scorer.score_game(full) == scorer.score_game(recent)
+            assert full.defections == recent.defections
+            assert len(runner.player1.history.recent) == strat1.lookback
+
+def test_recent_history_window():
+    history = gt.RecentHistory(3)
+    for move1, move2 in zip('CCDCD', 'DDCCD'):
+        history.add_moves(move1, move2)
+    assert len(history) == 5 and history.defections == [2, 3]
+    assert history[-1].move2 == 'D' and history[4] is history[-1]
+    assert [x.move2 for x in history[-2:]] == ['C', 'D']
+    with pytest.raises(IndexError):
+        history[1]
+    with pytest.raises(IndexError):
+        history[-5:]
+    with pytest.raises(TypeError):
+        list(history)
+
+def test_stream_sink_roundtrip(tmp_path):
+    path = f'{tmp_path}/moves.bin'
+    random.seed(1)
+    full = gt.MatchRunner(gt.Prober(), gt.Random(), gamelen=50).play()
+    random.seed(1)
+    with gt.MoveFileSink(path) as sink:
+        gt.MatchRunner(gt.Prober(), gt.Random(), gamelen=50, stream=True, sink=sink).play()
+    assert str(gt.read_moves(path)) == str(full)
+
+def test_stream_memory_is_bounded():
+    peaks = []
+    for gamelen in (2_000, 20_000):
+        runner = gt.MatchRunner(gt.Grudger(), gt.Cooperator(), gamelen=gamelen, stream=True)
+        tracemalloc.start()
+        runner.play()
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    assert peaks[1] < 2 * peaks[0] + 4096
+
+def test_stream_shared_history():
+    matches = [gt.MatchRunner(s1(), s2(), gamelen=45, stream=True) for s1 in STRATEGIES[:4] for s2 in STRATEGIES[:4]]
+    streamed = gt.play_matches_shared(matches, nworkers=0, history=True, seed=2)
+    full = gt.play_matches_shared([gt.MatchRunner(m.player1, m.player2, gamelen=45) for m in matches],
+                                  nworkers=0, history=True, seed=2)
+    assert all(str(streamed.history(i)) == str(full.history(i)) for i in range(len(matches)))
+    assert (streamed.scores == full.scores).all()
+
+if __name__ == '__main__':
+    main()
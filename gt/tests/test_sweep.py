@@ -0,0 +1,66 @@
+import random
+
+import numpy as np
+
+import gt
+from gt import sweep
+
+def main():
+    import tempfile
+    with tempfile.TemporaryDirectory() as tmp:
+        test_sweep_dedupes_and_caches(tmp)
+    with tempfile.TemporaryDirectory() as tmp:
+        test_sweep_cache_is_per_seed(tmp)
+    test_sweep_payoffs_are_free()
+    test_sweep_keeps_caller_random_state()
+    print('pass!')
+
+ROSTER = dict(SometimesDefect=dict(defect_prob=[0.1, 0.5]), TitForTat={}, Random={})
+
+def test_sweep_dedupes_and_caches(tmp_path):
+    cache = f'{tmp_path}/sweep.npz'
+    first = sweep.sweep(ROSTER, gamelens=[20], nrepeat=2, nworkers=0, cache=cache, progress=False)
+    # 2 grid points x 6 pairings, but TitForTat/Random pairings are shared between them
+    assert len(first) == 12
+    assert first.nplayed == 2 * (12 - 3) and first.ncached == 0
+    assert set(first.columns['SometimesDefect.defect_prob']) == {0.1, 0.5}
+
+    extended = dict(ROSTER, SometimesDefect=dict(defect_prob=[0.1, 0.5, 0.9]))
+    second = sweep.sweep(extended, gamelens=[20], nrepeat=2, nworkers=2, cache=cache, progress=False)
+    assert len(second) == 18
+    assert second.nplayed == 2 * 3 and second.ncached == 2 * 9
+    for col in ('strategy1', 'strategy2', 'score1', 'score2'):
+        assert np.all(second.columns[col][:12] == first.columns[col])
+
+    uncached = sweep.sweep(extended, gamelens=[20], nrepeat=2, nworkers=0, progress=False)
+    assert np.all(uncached.columns['score1'] == second.columns['score1'])
+    second.to_csv(f'{tmp_path}/sweep.csv')
+
+def test_sweep_cache_is_per_seed(tmp_path):
+    cache = f'{tmp_path}/sweep.npz'
+    sweep.sweep(ROSTER, gamelens=[20], seed=1, nworkers=0, cache=cache, progress=False)
+    reseeded = sweep.sweep(ROSTER, gamelens=[20], seed=2, nworkers=0, cache=cache, progress=False)
+    assert reseeded.ncached == 0
+    uncached = sweep.sweep(ROSTER, gamelens=[20], seed=2, nworkers=0, progress=False)
+    assert np.all(uncached.columns['score1'] == reseeded.columns['score1'])
+    again = sweep.sweep(ROSTER, gamelens=[20], seed=1, nworkers=0, cache=cache, progress=False)
+    assert again.nplayed == 0
+
+def test_sweep_payoffs_are_free():
+    payoffs = dict(standard=gt.default_payoff(), harsh=dict(CC=(2, 2), CD=(0, 5), DC=(5, 0), DD=(0, 0)))
+    result = sweep.sweep(dict(AlwaysDefect={}, AlwaysCooperate={}), payoffs, gamelens=[10, (5, 8)], nworkers=0,
+                         progress=False)
+    assert result.nplayed == 2 * 3
+    cols = result.columns
+    dd = (cols['strategy1'] == 'AlwaysDefect') & (cols['strategy2'] == 'AlwaysDefect') & (cols['gamelen'] == '10')
+    assert sorted(cols['score1'][dd]) == [0, 10]
+
+def test_sweep_keeps_caller_random_state():
+    random.seed(5)
+    expected = random.random()
+    random.seed(5)
+    sweep.sweep(ROSTER, gamelens=[10], nworkers=0, progress=False)
+    assert random.random() == expected
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+import time
+
+import numpy as np
+import pytest
+
+from gt.ai_tourney import Match, Tourney, TourneyConfig, TourneyPlayer, TourneyState, TourneyType
+
+def main():
+    test_player_view_attributes()
+    test_tourney_adopts_players()
+    test_apply_results_matches_set_result()
+    test_unattached_players_are_plain()
+    test_players_belong_to_one_tourney()
+    print(f'{bench_build_and_adopt():.3f}s to build and adopt 100k players')
+    print('pass!')
+
+def test_player_view_attributes():
+    player = TourneyPlayer('p1', 'Ann', score=4)
+    player.win_match(3)
+    player.draw_match(1)
+    assert (player.score, player.matches_played, player.matches_won, player.matches_drawn) == (8, 2, 1, 1)
+    assert not hasattr(player, '__dict__')
+    assert 'score=8' in repr(player)
+
+def test_tourney_adopts_players():
+    players = [TourneyPlayer(f'p{i}', f'p{i}', score=i) for i in range(20)]
+    tourney = Tourney(TourneyConfig(TourneyType.ROUND_ROBIN, 'rr'), players)
+    assert all(p._state is tourney.state for p in players)
+    assert np.all(tourney.state.player_table['score'] == np.arange(20))
+    match = tourney.matches[0]
+    match.set_result(winner=match.player2)
+    assert match.completed and match.winner is match.player2 and match.loser is match.player1
+    assert tourney.state.match_table['winner'][0] == 1
+    tourney.update_rankings()
+    assert tourney.rankings[0] is players[19]
+
+def test_apply_results_matches_set_result():
+    players = [TourneyPlayer(f'p{i}', f'p{i}') for i in range(6)]
+    state = TourneyState()
+    for p in players:
+        state.add_player(p)
+    pairs = [(0, 1), (2, 3), (4, 5), (0, 2), (1, 4)]
+    matches = [Match(f'm{k}', players[i], players[j]) for k, (i, j) in enumerate(pairs)]
+    winner, is_draw = np.array([0, 1, 0, 1, 0]), np.array([False, False, True, False, False])
+    state.apply_results(np.arange(5), winner, is_draw)
+
+    expected = [TourneyPlayer(f'p{i}', f'p{i}') for i in range(6)]
+    for (i, j), side, draw in zip(pairs, winner, is_draw):
+        Match('m', expected[i], expected[j]).set_result(None if draw else (expected[i], expected[j])[side], draw)
+    assert [repr(p) for p in players] == [repr(p) for p in expected]
+    assert [m.winner for m in matches] == [players[0], players[3], None, players[2], players[1]]
+    assert matches[2].is_draw and all(m.completed for m in matches)
+
+def test_unattached_players_are_plain():
+    players = [TourneyPlayer(f'p{i}', f'p{i}', score=i % 3) for i in range(10)]
+    players[4].win_match(3)
+    assert all(p._state is None for p in players) and players[4].score == 4
+    state = TourneyState()
+    state.add_players(players)
+    assert state.player_table['score'].tolist() == [0, 1, 2, 0, 4, 2, 0, 1, 2, 0]
+    assert state.player_table['matches_won'].tolist() == [0, 0, 0, 0, 1, 0, 0, 0, 0, 0]
+    assert players[4]._counters is None and players[4].matches_played == 1
+
+def test_players_belong_to_one_tourney():
+    players = [TourneyPlayer(f'p{i}', f'p{i}') for i in range(4)]
+    first = Tourney(TourneyConfig(TourneyType.ROUND_ROBIN, 'first'), players)
+    with pytest.raises(ValueError, match='already belongs'):
+        Tourney(TourneyConfig(TourneyType.ROUND_ROBIN, 'second'), players)
+    assert all(p._state is first.state for p in players)
+    other = Tourney(TourneyConfig(TourneyType.ROUND_ROBIN, 'other'), TourneyPlayer.create_many(['b0', 'b1'], ['', '']))
+    with pytest.raises(ValueError, match='different tournaments'):
+        Match('m', players[0], other.players[0])
+    # a player from a standalone match can still join a tournament, counters and all
+    solo = TourneyPlayer('solo', 'solo')
+    Match('m', solo, TourneyPlayer('x', 'x')).set_result(winner=solo)
+    Match('m', solo, players[1])
+    assert solo._state is first.state and solo.matches_won == 1
+
+def bench_build_and_adopt(nplayer=100_000):
+    start = time.perf_counter()
+    players = [TourneyPlayer(f'p{i}', f'p{i}', score=i % 7) for i in range(nplayer)]
+    TourneyState().add_players(players)
+    return time.perf_counter() - start
+
+@pytest.mark.ci
+def test_build_and_adopt_is_fast():
+    assert bench_build_and_adopt() < 1.0
+
+if __name__ == '__main__':
+    main()
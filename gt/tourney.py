@@ -1,6 +1,7 @@
-import names
 import random
 import abc
+import itertools
+import os
 from dataclasses import dataclass, field
 
 import gt
@@ -17,6 +18,11 @@ class Tourney:
         while match := self.matchmaker.next_match():
             match.play()
 
+    def run_parallel(self, nworkers=None, history=False, seed=None) -> gt.SharedMatchResults:
+        """play every scheduled match across processes, results come back as shared-memory arrays by slot"""
+        matches = list(iter(self.matchmaker.next_match, None))
+        return gt.play_matches_shared(matches, nworkers, history=history, seed=seed)
+
 @dataclass
 class MatchMaker:
     tourney: Tourney = None
@@ -30,10 +36,26 @@ class MatchMaker:
     def next_match(self) -> gt.MatchRunner:
         pass
 
-@dataclass
+def random_player_name():
+    import names  # loading the name corpus is slow, only pay for it when a random name is wanted
+    return names.get_first_name()
+
+_player_ids = itertools.count()
+
+def sequential_player_name():
+    return f'player{next(_player_ids)}'
+
+_player_name_factory = sequential_player_name if os.environ.get('GT_PLAYER_NAMES') == 'sequential' else random_player_name
+
+def set_player_name_factory(factory):
+    """choose how unnamed Players are named, eg sequential_player_name for cheap deterministic ids"""
+    global _player_name_factory
+    _player_name_factory = factory
+
+@dataclass(slots=True)
 class Player:
     strategy: gt.Strategy
-    name: str = field(default_factory=names.get_first_name)
+    name: str = field(default_factory=lambda: _player_name_factory())
 
     def __post_init__(self):
         if self.name is None: